@@ -1,5 +1,7 @@
 """Main entry point for the AI Smart Hiring Agent."""
 
+import os
+
 import uvicorn
 
 from src.config.settings import get_settings
@@ -7,6 +9,16 @@ from src.config.settings import get_settings
 settings = get_settings()
 
 
+def _worker_count() -> int:
+    """Resolve how many worker processes to start."""
+    # Auto-reload runs a single process and cannot be combined with workers
+    if settings.api_reload:
+        return 1
+    if settings.api_workers:
+        return settings.api_workers
+    return int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2))
+
+
 def main():
     """Run the FastAPI application."""
     uvicorn.run(
@@ -14,6 +26,7 @@ def main():
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_reload,
+        workers=_worker_count(),
     )
 
 
@@ -0,0 +1,104 @@
+"""Background batching of hiring action log writes."""
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import insert
+
+from src.database.connection import get_write_session
+from src.database.models import HiringAction
+
+logger = logging.getLogger(__name__)
+
+
+class HiringActionQueue:
+    """Buffer hiring actions and persist them in periodic multi-row inserts."""
+
+    def __init__(self, flush_interval_ms: int = 250, max_flush_attempts: int = 3):
+        """
+        Initialize the queue.
+
+        Args:
+            flush_interval_ms: How long queued actions are collected before a write
+            max_flush_attempts: Consecutive failed writes before queued actions are dropped
+        """
+        self.flush_interval = max(flush_interval_ms, 0) / 1000
+        self.max_flush_attempts = max(max_flush_attempts, 1)
+        self._rows: list[dict[str, Any]] = []
+        self._failed_flushes = 0
+        self._task: asyncio.Task | None = None
+
+    def put(
+        self,
+        candidate_id: int,
+        action_type: str,
+        description: str,
+        performed_by: str = "system",
+    ) -> None:
+        """Queue a hiring action without waiting for it to be written."""
+        self._ensure_worker()
+        self._rows.append(
+            {
+                "candidate_id": candidate_id,
+                "action_type": action_type,
+                "description": description,
+                "performed_by": performed_by,
+                "performed_at": datetime.utcnow(),
+            }
+        )
+
+    async def flush(self) -> bool:
+        """
+        Write every queued action in a single insert and commit.
+
+        Returns:
+            False if the write failed; the actions are requeued for the next
+            flush until ``max_flush_attempts`` consecutive writes have failed
+        """
+        rows, self._rows = self._rows, []
+        if not rows:
+            return True
+        try:
+            async with get_write_session() as session:
+                await session.execute(insert(HiringAction), rows)
+        except Exception:
+            self._failed_flushes += 1
+            if self._failed_flushes >= self.max_flush_attempts:
+                self._failed_flushes = 0
+                logger.exception("Dropping %d hiring actions after repeated write failures", len(rows))
+                return False
+            logger.warning("Failed to write %d hiring actions; will retry", len(rows), exc_info=True)
+            # Requeue ahead of anything put while the write was running
+            self._rows[:0] = rows
+            return False
+        self._failed_flushes = 0
+        return True
+
+    async def close(self) -> None:
+        """Stop the background writer and flush anything still queued."""
+        if self._task is not None and self._task.get_loop() is asyncio.get_running_loop():
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        # Failed writes requeue their rows, and are dropped once attempts run out
+        while self._rows:
+            await self.flush()
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        # Keep going while actions remain, including ones requeued by a failed write
+        while self._rows:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+
+action_queue = HiringActionQueue()
@@ -0,0 +1,55 @@
+"""Persistent cache for LLM resume analyses."""
+
+import hashlib
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import AnalysisCacheEntry
+from src.llm.ollama_service import ANALYSIS_FAILED_PREFIX
+
+
+class AnalysisCache:
+    """Exact-match cache of raw LLM analysis output stored in the database."""
+
+    @staticmethod
+    def fingerprint(model: str, resume_text: str, jd_text: str) -> str:
+        """
+        Build the cache key for a resume/JD pair.
+
+        Args:
+            model: LLM model name
+            resume_text: Resume text content
+            jd_text: Job description text
+
+        Returns:
+            SHA-256 hex digest identifying the analysis inputs
+        """
+        raw = f"{model}\0{resume_text or ''}\0{jd_text or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get(self, session: AsyncSession, fingerprint: str) -> dict[str, Any] | None:
+        """Return the cached analysis payload, if any."""
+        result = await session.execute(
+            select(AnalysisCacheEntry.payload).where(AnalysisCacheEntry.fingerprint == fingerprint)
+        )
+        payload = result.scalar_one_or_none()
+        return payload if isinstance(payload, dict) else None
+
+    async def put(self, session: AsyncSession, fingerprint: str, payload: dict[str, Any]) -> None:
+        """Stage an analysis payload for storage; the caller owns the commit."""
+        if not self.is_cacheable(payload):
+            return
+        await session.execute(
+            insert(AnalysisCacheEntry)
+            .values(fingerprint=fingerprint, payload=payload)
+            .on_conflict_do_nothing(index_elements=["fingerprint"])
+        )
+
+    @staticmethod
+    def is_cacheable(payload: dict[str, Any]) -> bool:
+        """Skip the fallback payload produced when the LLM call fails."""
+        recommendation = payload.get("recommendation")
+        return not (isinstance(recommendation, str) and recommendation.startswith(ANALYSIS_FAILED_PREFIX))
@@ -0,0 +1,60 @@
+"""Typed container for persisted candidate analysis values."""
+
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any
+
+from src.agent.scoring_engine import ScoringResult
+
+
+@dataclass(slots=True)
+class AnalysisPayload:
+    """Column values shared by CandidateAnalysis and CandidateAnalysisRun."""
+
+    skills: list[str] = field(default_factory=list)
+    experience_years: float = 0.0
+    tech_stack: list[str] = field(default_factory=list)
+    domain_knowledge: list[str] = field(default_factory=list)
+    seniority: str | None = None
+    strengths: list[str] = field(default_factory=list)
+    weaknesses: list[str] = field(default_factory=list)
+    skill_match_score: float = 0.0
+    experience_score: float = 0.0
+    domain_score: float = 0.0
+    project_complexity_score: float = 0.0
+    soft_skills_score: float = 0.0
+    final_score: float = 0.0
+    decision: str | None = None
+    recommendation: str | None = None
+    risks: list[str] = field(default_factory=list)
+    risk_level: str | None = None
+    technical_questions: list[str] = field(default_factory=list)
+    system_design_questions: list[str] = field(default_factory=list)
+    behavioral_questions: list[str] = field(default_factory=list)
+    custom_questions: list[str] = field(default_factory=list)
+    interview_focus_areas: list[str] = field(default_factory=list)
+    analysis_timestamp: datetime | None = None
+    model_used: str | None = None
+
+    @classmethod
+    def from_analysis(cls, analysis_data: dict[str, Any]) -> "AnalysisPayload":
+        """Build a payload from LLM output, ignoring keys that are not columns."""
+        return cls(**{name: analysis_data[name] for name in PAYLOAD_FIELDS if name in analysis_data})
+
+    def apply_scoring(self, scoring_result: ScoringResult) -> None:
+        """Overwrite the LLM scores with the scoring engine's results."""
+        self.skill_match_score = scoring_result.skill_match_score
+        self.experience_score = scoring_result.experience_score
+        self.domain_score = scoring_result.domain_score
+        self.project_complexity_score = scoring_result.project_complexity_score
+        self.soft_skills_score = scoring_result.soft_skills_score
+        self.final_score = scoring_result.final_score
+        self.decision = scoring_result.decision
+        self.recommendation = scoring_result.recommendation
+
+    def as_row(self) -> dict[str, Any]:
+        """Return column values keyed by name, without copying nested lists."""
+        return {name: getattr(self, name) for name in PAYLOAD_FIELDS}
+
+
+PAYLOAD_FIELDS = tuple(f.name for f in fields(AnalysisPayload))
@@ -1,31 +1,91 @@
 """Main hiring agent that orchestrates the entire hiring workflow."""
 
 import asyncio
+import copy
+import random
+from collections.abc import Sequence
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Bundle, aliased, selectinload
 
+from src.agent.action_queue import action_queue
+from src.agent.analysis_cache import AnalysisCache
+from src.agent.analysis_payload import AnalysisPayload
 from src.agent.scoring_engine import ScoringEngine, ScoringResult
-from src.database.connection import get_db_session
+from src.agent.single_flight import SingleFlight
+from src.config.settings import get_settings
+from src.database.connection import get_db_session, get_write_session
 from src.database.models import (
     Candidate,
     CandidateAnalysis,
     CandidateAnalysisRun,
-    HiringAction,
     JobDescription,
 )
-from src.llm.ollama_service import OllamaService
+from src.llm.analysis_batcher import AnalysisBatcher
+from src.llm.ollama_service import OllamaService, get_ollama_service
 from src.parsers.resume_parser import ResumeParser
 
 
+_MIN_INTERVIEW_QUESTIONS = 5
+
+# Fallback interview questions per section, formatted only when the LLM returns too few
+_FALLBACK_QUESTIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "technical_questions",
+        (
+            "Walk through a recent project where you used {skill}. What were the hardest technical challenges?",
+            "How do you validate correctness and reliability in your {skill} work?",
+            "Explain a performance issue you diagnosed and fixed in a system you built.",
+            "Describe your approach to testing and code reviews in production systems.",
+            "How do you handle backward compatibility and deployment risk in production?",
+        ),
+    ),
+    (
+        "system_design_questions",
+        (
+            "Design a scalable service relevant to {role}. Start with requirements and outline the architecture.",
+            "How would you design data storage and access patterns for {domain} workloads?",
+            "Discuss how you would handle failures, retries, and observability in a distributed system.",
+            "How would you scale the system as traffic grows 10x?",
+            "Describe tradeoffs between consistency and availability for a core feature in this role.",
+        ),
+    ),
+    (
+        "behavioral_questions",
+        (
+            "Tell me about a time you disagreed with a teammate. How did you resolve it?",
+            "Describe a situation where you had to learn a new technology quickly.",
+            "Give an example of a project you led end-to-end and how you managed stakeholders.",
+            "Tell me about a time you received critical feedback and what you changed.",
+            "Describe a time you improved a process or team outcome.",
+        ),
+    ),
+    (
+        "custom_questions",
+        (
+            "What would your 30-60-90 day plan look like for {role}?",
+            "Which part of the job description are you most excited about and why?",
+            "What risks do you see in this role and how would you mitigate them?",
+            "How do you decide when to ask for help versus push through on your own?",
+            "Tell us about a tradeoff you made in a recent project and why.",
+        ),
+    ),
+)
+
+
 class HiringAgent:
     """Autonomous AI hiring agent that analyzes candidates and makes hiring decisions."""
 
+    # LLM analyses currently running, keyed by cache fingerprint and shared by all agents
+    _inflight = SingleFlight()
+
     def __init__(self, ollama_service: OllamaService | None = None):
         """
         Initialize hiring agent.
@@ -33,9 +93,17 @@ class HiringAgent:
         Args:
             ollama_service: Optional Ollama service instance
         """
-        self.ollama = ollama_service or OllamaService()
+        self.ollama = ollama_service or get_ollama_service()
         self.scoring_engine = ScoringEngine()
         self.resume_parser = ResumeParser()
+        self.analysis_cache = AnalysisCache()
+        self._action_queue = action_queue
+        settings = get_settings()
+        self._batcher = AnalysisBatcher(
+            self.ollama,
+            max_batch_size=settings.ollama_batch_size,
+            max_wait_ms=settings.ollama_batch_window_ms,
+        )
 
     async def analyze_candidate(
         self,
@@ -61,111 +129,258 @@ class HiringAgent:
             should_close_session = True
 
         try:
-            # Fetch candidate with job description
+            # Fetch candidate and the target job description in one round-trip
+            jd_id = func.coalesce(literal(job_description_id), Candidate.job_description_id)
             result = await session.execute(
-                select(Candidate)
+                select(Candidate, JobDescription)
+                .outerjoin(JobDescription, JobDescription.id == jd_id)
                 .where(Candidate.id == candidate_id)
-                .options(selectinload(Candidate.job_description))
             )
-            candidate = result.scalar_one_or_none()
+            row = result.first()
 
-            if not candidate:
+            if not row:
                 raise ValueError(f"Candidate not found: {candidate_id}")
 
+            candidate, jd = row
+
+            if not jd:
+                raise ValueError(f"Job description not found for candidate: {candidate_id}")
+
+            analysis_data, cache_entry = await self._get_analysis_data(session, candidate, jd)
+            return await self._store_analysis(
+                candidate, jd, analysis_data, cache_entries=[cache_entry] if cache_entry else ()
+            )
+
+        finally:
+            if should_close_session:
+                await session.close()
+
+    async def analyze_candidates(
+        self,
+        candidate_ids: list[int],
+        job_description_id: int | None = None,
+        concurrency: int | None = None,
+        session: AsyncSession | None = None,
+    ) -> list[CandidateAnalysis]:
+        """
+        Analyze several candidates, running their LLM calls concurrently.
+
+        Args:
+            candidate_ids: IDs of the candidates to analyze
+            job_description_id: Optional JD to analyze against; defaults to each candidate's JD
+            concurrency: Maximum number of in-flight LLM calls
+            session: Optional database session
+
+        Returns:
+            CandidateAnalysis records in the order of ``candidate_ids``; unknown
+            candidates and candidates without a job description are skipped
+        """
+        should_close_session = False
+
+        if session is None:
+            session_context = get_db_session()
+            session = await session_context.__aenter__()
+            should_close_session = True
+
+        try:
+            result = await session.execute(
+                select(Candidate)
+                .where(Candidate.id.in_(candidate_ids))
+                .options(selectinload(Candidate.job_description))
+            )
+            candidates_by_id = {candidate.id: candidate for candidate in result.scalars().all()}
+
+            override_jd = None
             if job_description_id is not None:
                 jd_result = await session.execute(
                     select(JobDescription).where(JobDescription.id == job_description_id)
                 )
-                jd = jd_result.scalar_one_or_none()
-            else:
-                jd = candidate.job_description
+                override_jd = jd_result.scalar_one_or_none()
+                if not override_jd:
+                    raise ValueError(f"Job description not found: {job_description_id}")
+
+            pairs = []
+            for candidate_id in dict.fromkeys(candidate_ids):
+                candidate = candidates_by_id.get(candidate_id)
+                jd = override_jd or (candidate.job_description if candidate else None)
+                if candidate and jd:
+                    pairs.append((candidate, jd))
+
+            # The session cannot be shared across concurrent tasks, so only the
+            # LLM calls run in parallel; cache lookups and writes stay sequential.
+            semaphore = asyncio.Semaphore(max(concurrency or self._batcher.max_batch_size, 1))
+
+            async def analyze_one(candidate: Candidate, jd: JobDescription) -> dict[str, Any]:
+                async with semaphore:
+                    return await self._batcher.submit(
+                        resume_text=candidate.resume_text,
+                        jd_text=jd.description,
+                    )
+
+            cached = []
+            for candidate, jd in pairs:
+                fingerprint = self.analysis_cache.fingerprint(
+                    self.ollama.model, candidate.resume_text, jd.description
+                )
+                cached.append((fingerprint, await self.analysis_cache.get(session, fingerprint)))
+
+            misses = [index for index, (_, data) in enumerate(cached) if data is None]
+            fresh = await asyncio.gather(*(analyze_one(*pairs[index]) for index in misses))
+            # Fresh results are cached in the same transaction as their analysis row
+            cache_entries: dict[int, tuple[str, dict[str, Any]]] = {}
+            for index, analysis_data in zip(misses, fresh):
+                if analysis_data is None:
+                    raise ValueError("LLM returned no analysis data")
+                fingerprint = cached[index][0]
+                cache_entries[index] = (fingerprint, copy.deepcopy(analysis_data))
+                cached[index] = (fingerprint, analysis_data)
+
+            # Score the whole batch in one vectorized pass before persisting
+            prepared = [
+                self._prepare_analysis_data(analysis_data, candidate, jd)
+                for (candidate, jd), (_, analysis_data) in zip(pairs, cached)
+            ]
+            scoring_results = self.scoring_engine.score_many(prepared)
+
+            analyses = []
+            for index, ((candidate, jd), analysis_data, scoring_result) in enumerate(
+                zip(pairs, prepared, scoring_results)
+            ):
+                cache_entry = cache_entries.get(index)
+                analyses.append(
+                    await self._store_analysis(
+                        candidate,
+                        jd,
+                        analysis_data,
+                        scoring_result,
+                        cache_entries=[cache_entry] if cache_entry else (),
+                    )
+                )
+            return analyses
 
-            if not jd:
-                raise ValueError(f"Job description not found for candidate: {candidate_id}")
+        finally:
+            if should_close_session:
+                await session.close()
+
+    async def _get_analysis_data(
+        self,
+        session: AsyncSession,
+        candidate: Candidate,
+        jd: JobDescription,
+    ) -> tuple[dict[str, Any], tuple[str, dict[str, Any]] | None]:
+        """Return the LLM analysis for a candidate/JD pair, using the cache when possible.
+
+        Also returns the ``(fingerprint, payload)`` cache entry to store when the
+        analysis was freshly produced, so it is written with the analysis row.
+        """
+        # Reuse a previous LLM analysis of the same resume/JD pair when available
+        fingerprint = self.analysis_cache.fingerprint(
+            self.ollama.model, candidate.resume_text, jd.description
+        )
+        analysis_data = await self.analysis_cache.get(session, fingerprint)
+        if analysis_data is not None:
+            return analysis_data, None
 
-            # Run LLM analysis
-            analysis_data = await self.ollama.analyze_resume(
+        async def run_analysis() -> dict[str, Any]:
+            analysis_data = await self._batcher.submit(
                 resume_text=candidate.resume_text,
                 jd_text=jd.description,
             )
             if analysis_data is None:
                 raise ValueError("LLM returned no analysis data")
+            return analysis_data
 
-            analysis_data = self._normalize_analysis_data(analysis_data)
-            analysis_data = self._ensure_min_interview_questions(analysis_data, candidate, jd)
+        # Share an identical analysis that is already running instead of starting another
+        result, ran_here = await self._inflight.do(fingerprint, run_analysis)
+        # Callers normalize analysis_data in place, so the shared result is never handed out
+        analysis_data = copy.deepcopy(result)
+        return analysis_data, ((fingerprint, result) if ran_here else None)
+
+    async def _store_analysis(
+        self,
+        candidate: Candidate,
+        jd: JobDescription,
+        analysis_data: dict[str, Any],
+        scoring_result: ScoringResult | None = None,
+        cache_entries: Sequence[tuple[str, dict[str, Any]]] = (),
+    ) -> CandidateAnalysis:
+        """Score raw LLM output and persist it as the candidate's latest analysis.
+
+        When ``scoring_result`` is given, ``analysis_data`` must already have
+        been through ``_prepare_analysis_data``. ``cache_entries`` are written
+        to the analysis cache in the same transaction. Only this write holds the
+        writer connection, never the LLM call that produced ``analysis_data``.
+        """
+        # Only plain ids are used below; the ORM objects belong to the reading session
+        candidate_id = candidate.id
+        jd_id = jd.id
+
+        if scoring_result is None:
+            analysis_data = self._prepare_analysis_data(analysis_data, candidate, jd)
 
             # Calculate scores and decision
             scoring_result = self.scoring_engine.score_candidate(analysis_data)
 
-            # Update analysis data with scoring results
-            analysis_data.update(
-                {
-                    "skill_match_score": scoring_result.skill_match_score,
-                    "experience_score": scoring_result.experience_score,
-                    "domain_score": scoring_result.domain_score,
-                    "project_complexity_score": scoring_result.project_complexity_score,
-                    "soft_skills_score": scoring_result.soft_skills_score,
-                    "final_score": scoring_result.final_score,
-                    "decision": scoring_result.decision,
-                    "recommendation": scoring_result.recommendation,
-                    "analysis_timestamp": datetime.utcnow(),
-                    "model_used": self.ollama.model,
-                }
-            )
-
-            # Create immutable analysis run per JD
-            analysis_run = CandidateAnalysisRun(
-                candidate_id=candidate_id,
-                job_description_id=jd.id,
-                **analysis_data,
-            )
-            session.add(analysis_run)
+        # Collect the persisted columns, with scores from the scoring engine
+        payload = AnalysisPayload.from_analysis(analysis_data)
+        payload.apply_scoring(scoring_result)
+        payload.analysis_timestamp = datetime.utcnow()
+        payload.model_used = self.ollama.model
+        row = payload.as_row()
 
-            # Check if analysis already exists
-            existing_analysis = await session.execute(
-                select(CandidateAnalysis).where(CandidateAnalysis.candidate_id == candidate_id)
-            )
-            existing = existing_analysis.scalar_one_or_none()
-
-            if existing:
-                # Update existing analysis
-                for key, value in analysis_data.items():
-                    setattr(existing, key, value)
-                analysis = existing
-            else:
-                # Create new analysis
-                analysis = CandidateAnalysis(
-                    candidate_id=candidate_id,
-                    **analysis_data,
-                )
-                session.add(analysis)
+        # Create immutable analysis run per JD
+        run_insert = insert(CandidateAnalysisRun).values(
+            candidate_id=candidate_id,
+            job_description_id=jd_id,
+            **row,
+        )
 
-            for attempt in range(1, 4):
+        # Insert or overwrite the candidate's latest analysis in one statement
+        upsert = insert(CandidateAnalysis).values(candidate_id=candidate_id, **row)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["candidate_id"],
+            set_={key: upsert.excluded[key] for key in row},
+        ).returning(CandidateAnalysis)
+
+        # busy_timeout absorbs normal write contention inside SQLite; this only
+        # covers the rare lock that outlives it, with short jittered backoff.
+        async with get_write_session() as session:
+            for attempt in range(1, 6):
                 try:
+                    # Everything is (re)staged per attempt, since a rollback discards it
+                    for fingerprint, cached_payload in cache_entries:
+                        await self.analysis_cache.put(session, fingerprint, cached_payload)
+                    await session.execute(run_insert)
+                    result = await session.scalars(upsert, execution_options={"populate_existing": True})
+                    analysis = result.one()
                     await session.commit()
                     break
                 except OperationalError as exc:
                     if "database is locked" not in str(exc).lower():
                         raise
-                    if attempt == 3:
+                    if attempt == 5:
                         raise
                     await session.rollback()
-                    await asyncio.sleep(0.5 * attempt)
-            await session.refresh(analysis)
+                    await asyncio.sleep(min(random.random() * (1 << attempt) / 500, 0.1))
 
-            # Log action
-            await self._log_action(
-                session=session,
-                candidate_id=candidate_id,
-                action_type="analysis_completed",
-                description=f"Candidate analyzed with score {scoring_result.final_score}/100",
-            )
+        # Log action
+        self._log_action(
+            candidate_id=candidate_id,
+            action_type="analysis_completed",
+            description=f"Candidate analyzed with score {scoring_result.final_score}/100",
+        )
 
-            return analysis
+        return analysis
 
-        finally:
-            if should_close_session:
-                await session.close()
+    def _prepare_analysis_data(
+        self,
+        analysis_data: dict[str, Any],
+        candidate: Candidate,
+        jd: JobDescription,
+    ) -> dict[str, Any]:
+        """Normalize LLM output and top up interview questions before scoring."""
+        analysis_data = self._normalize_analysis_data(analysis_data)
+        return self._ensure_min_interview_questions(analysis_data, candidate, jd)
 
     @staticmethod
     def _normalize_analysis_data(analysis_data: dict[str, Any]) -> dict[str, Any]:
@@ -196,74 +411,41 @@ class HiringAgent:
         jd: JobDescription,
     ) -> dict[str, Any]:
         """Ensure at least 5 questions per interview section."""
-        skills = analysis_data.get("skills") or analysis_data.get("tech_stack") or []
-        primary_skill = skills[0] if skills else "the core technologies"
-        role_title = jd.title or "this role"
-        domain = jd.domain or "the domain"
-
-        def normalize_list(value: Any) -> list[str]:
-            if not isinstance(value, list):
-                return []
-            cleaned = []
-            for item in value:
-                if isinstance(item, str):
-                    stripped = item.strip()
-                    if stripped:
-                        cleaned.append(stripped)
-            return cleaned
-
-        def ensure_minimum(key: str, fallbacks: list[str]) -> None:
-            questions = normalize_list(analysis_data.get(key))
-            for fallback in fallbacks:
-                if len(questions) >= 5:
+        template_values: dict[str, str] | None = None
+
+        for key, templates in _FALLBACK_QUESTIONS:
+            questions = []
+            value = analysis_data.get(key)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, str):
+                        stripped = item.strip()
+                        if stripped:
+                            questions.append(stripped)
+            if len(questions) >= _MIN_INTERVIEW_QUESTIONS:
+                analysis_data[key] = questions
+                continue
+
+            # Fallback text is only formatted for sections that need topping up
+            if template_values is None:
+                skills = analysis_data.get("skills") or analysis_data.get("tech_stack") or []
+                template_values = {
+                    "skill": skills[0] if skills else "the core technologies",
+                    "role": jd.title or "this role",
+                    "domain": jd.domain or "the domain",
+                }
+            for template in templates:
+                if len(questions) >= _MIN_INTERVIEW_QUESTIONS:
                     break
+                fallback = template.format(**template_values)
                 if fallback not in questions:
                     questions.append(fallback)
-            while len(questions) < 5:
-                questions.append(f"Additional {key.replace('_', ' ')} question {len(questions) + 1} for {role_title}.")
+            while len(questions) < _MIN_INTERVIEW_QUESTIONS:
+                questions.append(
+                    f"Additional {key.replace('_', ' ')} question {len(questions) + 1} for {template_values['role']}."
+                )
             analysis_data[key] = questions
 
-        ensure_minimum(
-            "technical_questions",
-            [
-                f"Walk through a recent project where you used {primary_skill}. What were the hardest technical challenges?",
-                f"How do you validate correctness and reliability in your {primary_skill} work?",
-                "Explain a performance issue you diagnosed and fixed in a system you built.",
-                "Describe your approach to testing and code reviews in production systems.",
-                "How do you handle backward compatibility and deployment risk in production?",
-            ],
-        )
-        ensure_minimum(
-            "system_design_questions",
-            [
-                f"Design a scalable service relevant to {role_title}. Start with requirements and outline the architecture.",
-                f"How would you design data storage and access patterns for {domain} workloads?",
-                "Discuss how you would handle failures, retries, and observability in a distributed system.",
-                "How would you scale the system as traffic grows 10x?",
-                "Describe tradeoffs between consistency and availability for a core feature in this role.",
-            ],
-        )
-        ensure_minimum(
-            "behavioral_questions",
-            [
-                "Tell me about a time you disagreed with a teammate. How did you resolve it?",
-                "Describe a situation where you had to learn a new technology quickly.",
-                "Give an example of a project you led end-to-end and how you managed stakeholders.",
-                "Tell me about a time you received critical feedback and what you changed.",
-                "Describe a time you improved a process or team outcome.",
-            ],
-        )
-        ensure_minimum(
-            "custom_questions",
-            [
-                f"What would your 30-60-90 day plan look like for {role_title}?",
-                "Which part of the job description are you most excited about and why?",
-                "What risks do you see in this role and how would you mitigate them?",
-                "How do you decide when to ask for help versus push through on your own?",
-                "Tell us about a tradeoff you made in a recent project and why.",
-            ],
-        )
-
         return analysis_data
 
     async def process_resume(
@@ -289,7 +471,7 @@ class HiringAgent:
         Returns:
             Created Candidate record
         """
-        async with get_db_session() as session:
+        async with get_write_session() as session:
             # Verify job description exists
             result = await session.execute(
                 select(JobDescription).where(JobDescription.id == job_description_id)
@@ -310,11 +492,9 @@ class HiringAgent:
             )
             session.add(candidate)
             await session.commit()
-            await session.refresh(candidate)
 
             # Log action
-            await self._log_action(
-                session=session,
+            self._log_action(
                 candidate_id=candidate.id,
                 action_type="candidate_created",
                 description=f"Candidate created from resume",
@@ -343,8 +523,8 @@ class HiringAgent:
         Returns:
             Created Candidate record
         """
-        # Parse resume file
-        resume_text = self.resume_parser.parse_and_clean(file_path)
+        # Parse resume file off the event loop
+        resume_text = await self.resume_parser.parse_and_clean_async(file_path)
 
         return await self.process_resume(
             resume_text=resume_text,
@@ -376,7 +556,7 @@ class HiringAgent:
         Returns:
             Created JobDescription record
         """
-        async with get_db_session() as session:
+        async with get_write_session() as session:
             jd = JobDescription(
                 title=title,
                 description=description,
@@ -386,7 +566,6 @@ class HiringAgent:
             )
             session.add(jd)
             await session.commit()
-            await session.refresh(jd)
 
             return jd
 
@@ -407,31 +586,23 @@ class HiringAgent:
         """
         async with get_db_session() as session:
             # Fetch latest analysis run per candidate for this JD
-            latest_subq = (
-                select(
-                    CandidateAnalysisRun.candidate_id.label("candidate_id"),
-                    CandidateAnalysisRun.job_description_id.label("job_description_id"),
-                    func.max(CandidateAnalysisRun.id).label("latest_id"),
-                )
-                .where(CandidateAnalysisRun.job_description_id == job_description_id)
-                .group_by(CandidateAnalysisRun.candidate_id, CandidateAnalysisRun.job_description_id)
-                .subquery()
-            )
-            result = await session.execute(
-                select(Candidate, CandidateAnalysisRun)
-                .join(latest_subq, latest_subq.c.candidate_id == Candidate.id)
-                .join(CandidateAnalysisRun, CandidateAnalysisRun.id == latest_subq.c.latest_id)
+            latest_run, row_number = self._latest_runs(job_description_id)
+            candidate_columns, run_columns = self._row_bundles(latest_run)
+            result = await session.stream(
+                select(candidate_columns, run_columns)
+                .join(latest_run, latest_run.candidate_id == Candidate.id)
+                .where(row_number == 1)
                 .where(Candidate.job_description_id == job_description_id)
-                .order_by(CandidateAnalysisRun.final_score.desc())
+                .order_by(latest_run.final_score.desc())
                 .limit(limit)
             )
 
             candidates = []
-            for candidate, analysis in result:
+            async for candidate, analysis in result:
                 candidates.append(
                     {
-                        "candidate": candidate.to_dict(),
-                        "analysis": analysis.to_dict(),
+                        "candidate": Candidate.serialize(candidate),
+                        "analysis": CandidateAnalysisRun.serialize(analysis),
                     }
                 )
 
@@ -440,15 +611,20 @@ class HiringAgent:
     async def generate_hiring_report(
         self,
         job_description_id: int,
+        limit_per_decision: int = 50,
     ) -> dict[str, Any]:
         """
         Generate a comprehensive hiring report.
 
         Args:
             job_description_id: ID of the job description
+            limit_per_decision: Maximum number of top-scoring candidates listed per decision bucket
 
         Returns:
-            Hiring report with statistics and recommendations
+            Hiring report with statistics and recommendations. The summary counts
+            every candidate; each decision list holds at most ``limit_per_decision``
+            top scorers, ``truncated`` flags the lists that were cut, and
+            ``ranked_candidates`` ranks only the listed candidates.
         """
         async with get_db_session() as session:
             # Fetch job description
@@ -460,67 +636,120 @@ class HiringAgent:
             if not jd:
                 raise ValueError(f"Job description not found: {job_description_id}")
 
-            # Fetch latest analysis run per candidate for this JD
-            latest_subq = (
-                select(
-                    CandidateAnalysisRun.candidate_id.label("candidate_id"),
-                    CandidateAnalysisRun.job_description_id.label("job_description_id"),
-                    func.max(CandidateAnalysisRun.id).label("latest_id"),
-                )
-                .where(CandidateAnalysisRun.job_description_id == job_description_id)
-                .group_by(CandidateAnalysisRun.candidate_id, CandidateAnalysisRun.job_description_id)
-                .subquery()
+            # Latest analysis run per candidate for this JD, bucketed by decision
+            latest_run, row_number = self._latest_runs(job_description_id)
+            bucket = case(
+                (latest_run.decision == "strong_hire", "strong_hire"),
+                (latest_run.decision == "borderline", "borderline"),
+                else_="reject",
+            ).label("bucket")
+
+            # Counts and score totals are aggregated in SQL
+            totals_result = await session.execute(
+                select(bucket, func.count(), func.coalesce(func.sum(latest_run.final_score), 0.0))
+                .select_from(latest_run)
+                .join(Candidate, Candidate.id == latest_run.candidate_id)
+                .where(row_number == 1)
+                .where(Candidate.job_description_id == job_description_id)
+                .group_by(bucket)
             )
-            result = await session.execute(
-                select(Candidate, CandidateAnalysisRun)
-                .join(latest_subq, latest_subq.c.candidate_id == Candidate.id)
-                .join(CandidateAnalysisRun, CandidateAnalysisRun.id == latest_subq.c.latest_id)
+            counts = {"strong_hire": 0, "borderline": 0, "reject": 0}
+            score_sum = 0.0
+            for bucket_name, count, bucket_score_sum in totals_result:
+                counts[bucket_name] = count
+                score_sum += bucket_score_sum
+
+            # Only the top rows of each bucket are loaded for display
+            bucket_rank = (
+                func.row_number()
+                .over(partition_by=bucket, order_by=latest_run.final_score.desc())
+                .label("bucket_rank")
+            )
+            ranked_subq = (
+                select(latest_run, bucket, bucket_rank)
+                .join(Candidate, Candidate.id == latest_run.candidate_id)
+                .where(row_number == 1)
                 .where(Candidate.job_description_id == job_description_id)
+                .subquery()
+            )
+            top_run = aliased(CandidateAnalysisRun, ranked_subq)
+            candidate_columns, run_columns = self._row_bundles(top_run)
+            result = await session.stream(
+                select(candidate_columns, run_columns, ranked_subq.c.bucket)
+                .join(top_run, top_run.candidate_id == Candidate.id)
+                .where(ranked_subq.c.bucket_rank <= limit_per_decision)
+                .order_by(top_run.final_score.desc())
             )
 
             candidates_data = []
-            strong_hires = []
-            borderline = []
-            rejects = []
+            buckets: dict[str, list[dict[str, Any]]] = {"strong_hire": [], "borderline": [], "reject": []}
 
-            for candidate, analysis in result:
+            async for candidate, analysis, bucket_name in result:
                 candidate_data = {
-                    "candidate": candidate.to_dict(),
-                    "analysis": analysis.to_dict(),
+                    "candidate": Candidate.serialize(candidate),
+                    "analysis": CandidateAnalysisRun.serialize(analysis),
                 }
                 candidates_data.append(candidate_data)
-
-                if analysis.decision == "strong_hire":
-                    strong_hires.append(candidate_data)
-                elif analysis.decision == "borderline":
-                    borderline.append(candidate_data)
-                else:
-                    rejects.append(candidate_data)
+                buckets[bucket_name].append(candidate_data)
 
             # Calculate statistics
-            total = len(candidates_data)
-            avg_score = sum(c["analysis"]["final_score"] for c in candidates_data) / total if total > 0 else 0
+            total = sum(counts.values())
+            avg_score = score_sum / total if total > 0 else 0
 
             report = {
                 "job_description": jd.to_dict(),
                 "summary": {
                     "total_candidates": total,
-                    "strong_hires": len(strong_hires),
-                    "borderline": len(borderline),
-                    "rejects": len(rejects),
+                    "strong_hires": counts["strong_hire"],
+                    "borderline": counts["borderline"],
+                    "rejects": counts["reject"],
                     "average_score": round(avg_score, 2),
                 },
                 "ranked_candidates": self.scoring_engine.rank_candidates(
                     [c["analysis"] for c in candidates_data]
                 ),
-                "strong_hires": strong_hires,
-                "borderline": borderline,
-                "rejects": rejects,
+                "strong_hires": buckets["strong_hire"],
+                "borderline": buckets["borderline"],
+                "rejects": buckets["reject"],
+                "truncated": {
+                    "strong_hires": counts["strong_hire"] > len(buckets["strong_hire"]),
+                    "borderline": counts["borderline"] > len(buckets["borderline"]),
+                    "rejects": counts["reject"] > len(buckets["reject"]),
+                },
                 "generated_at": datetime.utcnow().isoformat(),
             }
 
             return report
 
+    @staticmethod
+    def _latest_runs(job_description_id: int) -> tuple[Any, Any]:
+        """Return the latest analysis run per candidate for a JD and its row-number column."""
+        row_number = (
+            func.row_number()
+            .over(
+                partition_by=CandidateAnalysisRun.candidate_id,
+                order_by=CandidateAnalysisRun.id.desc(),
+            )
+            .label("rn")
+        )
+        latest_subq = (
+            select(CandidateAnalysisRun, row_number)
+            .where(CandidateAnalysisRun.job_description_id == job_description_id)
+            .subquery()
+        )
+        return aliased(CandidateAnalysisRun, latest_subq), latest_subq.c.rn
+
+    @staticmethod
+    def _row_bundles(run: Any) -> tuple[Bundle, Bundle]:
+        """Plain column bundles for a candidate and an analysis run, bypassing ORM entities."""
+        candidate_columns = Bundle(
+            "candidate", *(getattr(Candidate, column.key) for column in Candidate.__table__.columns)
+        )
+        run_columns = Bundle(
+            "analysis", *(getattr(run, column.key) for column in CandidateAnalysisRun.__table__.columns)
+        )
+        return candidate_columns, run_columns
+
     async def get_interview_strategy(
         self,
         candidate_id: int,
@@ -554,6 +783,7 @@ class HiringAgent:
                     CandidateAnalysisRun.job_description_id == jd.id,
                 )
                 .order_by(CandidateAnalysisRun.id.desc())
+                .limit(1)
             )
             analysis = run_result.scalars().first()
             if not analysis:
@@ -579,18 +809,22 @@ class HiringAgent:
                 },
             }
 
-    async def _log_action(
+    def _log_action(
         self,
-        session: AsyncSession,
         candidate_id: int,
         action_type: str,
         description: str,
     ) -> None:
-        """Log a hiring action."""
-        action = HiringAction(
+        """Log a hiring action; it is written by the background action queue."""
+        self._action_queue.put(
             candidate_id=candidate_id,
             action_type=action_type,
             description=description,
             performed_by="system",
         )
-        session.add(action)
+
+
+@lru_cache(maxsize=1)
+def get_hiring_agent() -> HiringAgent:
+    """Get the shared hiring agent, so concurrent requests share one analysis batcher."""
+    return HiringAgent()
@@ -1,16 +1,126 @@
 """Scoring engine for candidate evaluation."""
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
-from src.config.settings import get_settings
-
-settings = get_settings()
+import numpy as np
 
+from src.config.settings import get_settings
 
-@dataclass
+# Sub-score fields in weight-vector order
+_SCORE_FIELDS = (
+    ("skill_match_score", "skill_match"),
+    ("experience_score", "experience"),
+    ("domain_score", "domain_knowledge"),
+    ("project_complexity_score", "project_complexity"),
+    ("soft_skills_score", "soft_skills"),
+)
+
+# Risk levels in threshold-table row order; unknown levels use the "low" row
+_RISK_LEVELS = ("low", "medium", "high")
+_RISK_INDEX = {level: index for index, level in enumerate(_RISK_LEVELS)}
+
+_STRONG_HIRE_HEADER = "**Strong Hire Recommendation** (Score: {score}/100)\n\n"
+_BORDERLINE_HEADER = "**Borderline Candidate** (Score: {score}/100)\n\n"
+_REJECT_HEADER = "**Not Recommended** (Score: {score}/100)\n\n"
+
+
+def _as_list(value: Any) -> list[str]:
+    """Normalize possibly null values into a list."""
+    return value if type(value) is list else []
+
+
+def _build_strong_hire_recommendation(
+    final_score: float,
+    strengths: Sequence[str],
+    weaknesses: Sequence[str],
+    risks: Sequence[str],
+    interview_focus_areas: Sequence[str],
+) -> str:
+    """Build the recommendation text for a strong hire."""
+    top_strengths = ", ".join(strengths[:3])
+    top_focus_areas = ", ".join(interview_focus_areas[:3])
+    parts = [
+        _STRONG_HIRE_HEADER.format(score=final_score),
+        "This candidate is well-qualified for the role. ",
+    ]
+    if strengths:
+        parts.append(f"Key strengths: {top_strengths}. ")
+    if risks:
+        parts.append(f"Note: {len(risks)} risk(s) identified that should be explored in interviews. ")
+    parts.append("Proceed to technical interview round.")
+    if interview_focus_areas:
+        parts.append(f"\n\nFocus areas: {top_focus_areas}.")
+    return "".join(parts)
+
+
+def _build_borderline_recommendation(
+    final_score: float,
+    strengths: Sequence[str],
+    weaknesses: Sequence[str],
+    risks: Sequence[str],
+    interview_focus_areas: Sequence[str],
+) -> str:
+    """Build the recommendation text for a borderline candidate."""
+    top_strengths = ", ".join(strengths[:2])
+    top_weaknesses = ", ".join(weaknesses[:2])
+    top_risks = ", ".join(risks[:2])
+    top_focus_areas = ", ".join(interview_focus_areas[:3])
+    parts = [
+        _BORDERLINE_HEADER.format(score=final_score),
+        "This candidate shows potential but has some gaps. ",
+    ]
+    if strengths:
+        parts.append(f"Strengths: {top_strengths}. ")
+    if weaknesses:
+        parts.append(f"Areas of concern: {top_weaknesses}. ")
+    if risks:
+        parts.append(f"Risks: {top_risks}. ")
+    parts.append("Consider for interview if other candidates are not stronger.")
+    if interview_focus_areas:
+        parts.append(f"\n\nMust verify: {top_focus_areas}.")
+    return "".join(parts)
+
+
+def _build_reject_recommendation(
+    final_score: float,
+    strengths: Sequence[str],
+    weaknesses: Sequence[str],
+    risks: Sequence[str],
+    interview_focus_areas: Sequence[str],
+) -> str:
+    """Build the recommendation text for a rejected candidate."""
+    top_weaknesses = ", ".join(weaknesses[:3])
+    top_risks = ", ".join(risks[:3])
+    parts = [
+        _REJECT_HEADER.format(score=final_score),
+        "This candidate does not meet the requirements for the role. ",
+    ]
+    if weaknesses:
+        parts.append(f"Primary concerns: {top_weaknesses}. ")
+    if risks:
+        parts.append(f"Significant risks: {top_risks}. ")
+    parts.append("Do not proceed to interview.")
+    return "".join(parts)
+
+
+# Recommendation builders by decision; any other decision is treated as a reject
+_RECOMMENDATION_BUILDERS = {
+    "strong_hire": _build_strong_hire_recommendation,
+    "borderline": _build_borderline_recommendation,
+    "reject": _build_reject_recommendation,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ScoringResult:
-    """Result of candidate scoring."""
+    """Result of candidate scoring.
+
+    The recommendation text is built from the stored inputs on first access,
+    so callers that only rank or filter on scores never generate it.
+    """
 
     skill_match_score: float
     experience_score: float
@@ -19,16 +129,64 @@ class ScoringResult:
     soft_skills_score: float
     final_score: float
     decision: str
-    recommendation: str
+    strengths: tuple[str, ...] = field(default=(), repr=False, compare=False)
+    weaknesses: tuple[str, ...] = field(default=(), repr=False, compare=False)
+    risks: tuple[str, ...] = field(default=(), repr=False, compare=False)
+    interview_focus_areas: tuple[str, ...] = field(default=(), repr=False, compare=False)
+    _recommendation: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def recommendation(self) -> str:
+        """Hiring recommendation text, generated once and then reused."""
+        if self._recommendation is None:
+            recommendation = ScoringEngine.generate_recommendation(
+                self.final_score,
+                self.decision,
+                self.strengths,
+                self.weaknesses,
+                self.risks,
+                self.interview_focus_areas,
+            )
+            object.__setattr__(self, "_recommendation", recommendation)
+        return self._recommendation
 
 
 class ScoringEngine:
     """Engine for scoring candidates based on multiple dimensions."""
 
-    def __init__(self):
-        """Initialize scoring engine with settings."""
-        self.weights = settings.scoring_weights
-        self.thresholds = settings.decision_thresholds
+    # Results shared across engine instances, keyed by configuration and scoring inputs
+    _score_cache: OrderedDict[tuple, ScoringResult] = OrderedDict()
+    _score_cache_size = 4096
+
+    # Configuration derived from settings, shared by every instance; see reload_settings
+    weights: dict[str, int]
+    thresholds: dict[str, int]
+    _config_key: tuple
+    _weight_vec: np.ndarray
+    _threshold_table: dict[str, tuple[int, int]]
+    _threshold_arr: np.ndarray
+
+    @classmethod
+    def reload_settings(cls) -> None:
+        """Recompute the weights and thresholds shared by all engines from settings."""
+        settings = get_settings()
+        cls.weights = settings.scoring_weights
+        cls.thresholds = settings.decision_thresholds
+        cls._config_key = (tuple(cls.weights.items()), tuple(cls.thresholds.items()))
+        cls._weight_vec = np.asarray(
+            [cls.weights[weight_key] for _, weight_key in _SCORE_FIELDS], dtype=np.float64
+        ) / 100.0
+
+        # (strong_hire, borderline) thresholds adjusted for each risk level
+        strong_hire, borderline = cls.thresholds["strong_hire"], cls.thresholds["borderline"]
+        cls._threshold_table = {
+            "low": (strong_hire, borderline),
+            "medium": (strong_hire + 5, borderline),
+            "high": (strong_hire + 10, borderline + 5),
+        }
+        cls._threshold_arr = np.array(
+            [cls._threshold_table[level] for level in _RISK_LEVELS], dtype=np.float64
+        )
 
     def calculate_final_score(
         self,
@@ -51,15 +209,82 @@ class ScoringEngine:
         Returns:
             Final weighted score (0-100)
         """
-        final_score = (
-            skill_match_score * self.weights["skill_match"] / 100
-            + experience_score * self.weights["experience"] / 100
-            + domain_score * self.weights["domain_knowledge"] / 100
-            + project_complexity_score * self.weights["project_complexity"] / 100
-            + soft_skills_score * self.weights["soft_skills"] / 100
+        scores = np.array(
+            [[skill_match_score, experience_score, domain_score, project_complexity_score, soft_skills_score]],
+            dtype=np.float64,
+        )
+        return float(self._weighted_totals(scores)[0])
+
+    def _weighted_totals(self, scores: np.ndarray) -> np.ndarray:
+        """Weighted final scores, rounded to 2 decimals, for rows of sub-scores.
+
+        Columns are accumulated one at a time, so a row gets exactly the same
+        float operations whether it is scored alone or as part of a batch.
+        """
+        totals = np.zeros(len(scores), dtype=np.float64)
+        for column, weight in enumerate(self._weight_vec):
+            totals += scores[:, column] * weight
+        return np.round(totals, 2)
+
+    def score_candidates_batch(self, analyses: list[dict[str, Any]]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute final scores and decisions for many analyses at once.
+
+        Args:
+            analyses: LLM analysis results
+
+        Returns:
+            Tuple of final scores (float array) and decisions (string array), in input order
+        """
+        scores = np.array(
+            [[analysis.get(field, 0) or 0 for field, _ in _SCORE_FIELDS] for analysis in analyses],
+            dtype=np.float64,
+        ).reshape(len(analyses), len(_SCORE_FIELDS))
+        finals = self._weighted_totals(scores)
+
+        # Same risk-based threshold adjustments as determine_decision
+        risk_index = np.fromiter(
+            (_RISK_INDEX.get(str(analysis.get("risk_level")), 0) for analysis in analyses),
+            dtype=np.intp,
+            count=len(analyses),
+        )
+        strong, borderline = self._threshold_arr[risk_index].T
+        decisions = np.select(
+            [finals >= strong, finals >= borderline],
+            ["strong_hire", "borderline"],
+            default="reject",
         )
+        return finals, decisions
 
-        return round(final_score, 2)
+    def score_many(self, analyses: list[dict[str, Any]]) -> list[ScoringResult]:
+        """
+        Score many candidates in one vectorized pass.
+
+        Args:
+            analyses: LLM analysis results
+
+        Returns:
+            ScoringResults in input order
+        """
+        finals, decisions = self.score_candidates_batch(analyses)
+        results = []
+        for analysis, final_score, decision in zip(analyses, finals.tolist(), decisions.tolist()):
+            results.append(
+                ScoringResult(
+                    skill_match_score=analysis.get("skill_match_score", 0),
+                    experience_score=analysis.get("experience_score", 0),
+                    domain_score=analysis.get("domain_score", 0),
+                    project_complexity_score=analysis.get("project_complexity_score", 0),
+                    soft_skills_score=analysis.get("soft_skills_score", 0),
+                    final_score=final_score,
+                    decision=decision,
+                    strengths=tuple(_as_list(analysis.get("strengths"))),
+                    weaknesses=tuple(_as_list(analysis.get("weaknesses"))),
+                    risks=tuple(_as_list(analysis.get("risks"))),
+                    interview_focus_areas=tuple(_as_list(analysis.get("interview_focus_areas"))),
+                )
+            )
+        return results
 
     def determine_decision(self, final_score: float, risk_level: str = "low") -> str:
         """
@@ -72,16 +297,11 @@ class ScoringEngine:
         Returns:
             Decision string (strong_hire, borderline, reject, hold)
         """
-        # Adjust thresholds based on risk level
-        if risk_level == "high":
-            strong_hire_threshold = self.thresholds["strong_hire"] + 10
-            borderline_threshold = self.thresholds["borderline"] + 5
-        elif risk_level == "medium":
-            strong_hire_threshold = self.thresholds["strong_hire"] + 5
-            borderline_threshold = self.thresholds["borderline"]
-        else:  # low risk
-            strong_hire_threshold = self.thresholds["strong_hire"]
-            borderline_threshold = self.thresholds["borderline"]
+        if not isinstance(risk_level, str):
+            risk_level = "low"
+        strong_hire_threshold, borderline_threshold = self._threshold_table.get(
+            risk_level, self._threshold_table["low"]
+        )
 
         if final_score >= strong_hire_threshold:
             return "strong_hire"
@@ -90,14 +310,14 @@ class ScoringEngine:
         else:
             return "reject"
 
+    @staticmethod
     def generate_recommendation(
-        self,
         final_score: float,
         decision: str,
-        strengths: list[str],
-        weaknesses: list[str],
-        risks: list[str],
-        interview_focus_areas: list[str],
+        strengths: Sequence[str],
+        weaknesses: Sequence[str],
+        risks: Sequence[str],
+        interview_focus_areas: Sequence[str],
     ) -> str:
         """
         Generate hiring recommendation text.
@@ -113,40 +333,8 @@ class ScoringEngine:
         Returns:
             Recommendation text
         """
-        if decision == "strong_hire":
-            base = f"**Strong Hire Recommendation** (Score: {final_score}/100)\n\n"
-            base += "This candidate is well-qualified for the role. "
-            if strengths:
-                base += f"Key strengths: {', '.join(strengths[:3])}. "
-            if risks:
-                base += f"Note: {len(risks)} risk(s) identified that should be explored in interviews. "
-            base += "Proceed to technical interview round."
-            if interview_focus_areas:
-                base += f"\n\nFocus areas: {', '.join(interview_focus_areas[:3])}."
-
-        elif decision == "borderline":
-            base = f"**Borderline Candidate** (Score: {final_score}/100)\n\n"
-            base += "This candidate shows potential but has some gaps. "
-            if strengths:
-                base += f"Strengths: {', '.join(strengths[:2])}. "
-            if weaknesses:
-                base += f"Areas of concern: {', '.join(weaknesses[:2])}. "
-            if risks:
-                base += f"Risks: {', '.join(risks[:2])}. "
-            base += "Consider for interview if other candidates are not stronger."
-            if interview_focus_areas:
-                base += f"\n\nMust verify: {', '.join(interview_focus_areas[:3])}."
-
-        else:  # reject
-            base = f"**Not Recommended** (Score: {final_score}/100)\n\n"
-            base += "This candidate does not meet the requirements for the role. "
-            if weaknesses:
-                base += f"Primary concerns: {', '.join(weaknesses[:3])}. "
-            if risks:
-                base += f"Significant risks: {', '.join(risks[:3])}. "
-            base += "Do not proceed to interview."
-
-        return base
+        build = _RECOMMENDATION_BUILDERS.get(decision, _build_reject_recommendation)
+        return build(final_score, strengths, weaknesses, risks, interview_focus_areas)
 
     def score_candidate(self, analysis: dict[str, Any]) -> ScoringResult:
         """
@@ -158,6 +346,49 @@ class ScoringEngine:
         Returns:
             ScoringResult with all scores and decision
         """
+        strengths = tuple(_as_list(analysis.get("strengths")))
+        weaknesses = tuple(_as_list(analysis.get("weaknesses")))
+        risks = tuple(_as_list(analysis.get("risks")))
+        interview_focus_areas = tuple(_as_list(analysis.get("interview_focus_areas")))
+
+        # Scoring is deterministic in these fields, so identical inputs reuse the result
+        key = (
+            self._config_key,
+            analysis.get("skill_match_score", 0),
+            analysis.get("experience_score", 0),
+            analysis.get("domain_score", 0),
+            analysis.get("project_complexity_score", 0),
+            analysis.get("soft_skills_score", 0),
+            analysis.get("risk_level", "low"),
+            strengths,
+            weaknesses,
+            risks,
+            interview_focus_areas,
+        )
+        try:
+            cached = self._score_cache.get(key)
+        except TypeError:
+            # Unhashable values from the LLM; score without caching
+            return self._score(analysis, strengths, weaknesses, risks, interview_focus_areas)
+        if cached is not None:
+            self._score_cache.move_to_end(key)
+            return cached
+
+        result = self._score(analysis, strengths, weaknesses, risks, interview_focus_areas)
+        self._score_cache[key] = result
+        if len(self._score_cache) > self._score_cache_size:
+            self._score_cache.popitem(last=False)
+        return result
+
+    def _score(
+        self,
+        analysis: dict[str, Any],
+        strengths: tuple[str, ...],
+        weaknesses: tuple[str, ...],
+        risks: tuple[str, ...],
+        interview_focus_areas: tuple[str, ...],
+    ) -> ScoringResult:
+        """Compute scores and decision for an analysis."""
         # Extract scores from analysis
         skill_match_score = analysis.get("skill_match_score", 0)
         experience_score = analysis.get("experience_score", 0)
@@ -178,21 +409,6 @@ class ScoringEngine:
         risk_level = analysis.get("risk_level", "low")
         decision = self.determine_decision(final_score, risk_level)
 
-        # Generate recommendation
-        strengths = self._as_list(analysis.get("strengths"))
-        weaknesses = self._as_list(analysis.get("weaknesses"))
-        risks = self._as_list(analysis.get("risks"))
-        interview_focus_areas = self._as_list(analysis.get("interview_focus_areas"))
-
-        recommendation = self.generate_recommendation(
-            final_score,
-            decision,
-            strengths,
-            weaknesses,
-            risks,
-            interview_focus_areas,
-        )
-
         return ScoringResult(
             skill_match_score=skill_match_score,
             experience_score=experience_score,
@@ -201,16 +417,12 @@ class ScoringEngine:
             soft_skills_score=soft_skills_score,
             final_score=final_score,
             decision=decision,
-            recommendation=recommendation,
+            strengths=strengths,
+            weaknesses=weaknesses,
+            risks=risks,
+            interview_focus_areas=interview_focus_areas,
         )
 
-    @staticmethod
-    def _as_list(value: Any) -> list[str]:
-        """Normalize possibly null values into a list."""
-        if isinstance(value, list):
-            return value
-        return []
-
     def rank_candidates(self, candidates: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Rank candidates by their final scores.
@@ -221,11 +433,20 @@ class ScoringEngine:
         Returns:
             Ranked list of candidates
         """
-        # Sort by final score descending
-        ranked = sorted(candidates, key=lambda x: x.get("final_score", 0), reverse=True)
+        # Stable descending sort on the scores, ties keep their input order
+        scores = np.fromiter(
+            (candidate.get("final_score") or 0 for candidate in candidates),
+            dtype=np.float64,
+            count=len(candidates),
+        )
+        order = np.argsort(-scores, kind="stable")
+        ranked = [candidates[i] for i in order.tolist()]
 
         # Add rank
         for i, candidate in enumerate(ranked, 1):
             candidate["rank"] = i
 
         return ranked
+
+
+ScoringEngine.reload_settings()
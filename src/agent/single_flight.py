@@ -0,0 +1,55 @@
+"""Deduplication of concurrent identical async calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run one call per key at a time and let concurrent duplicates wait for it."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        Await ``call()``, or the call already running under ``key``.
+
+        Args:
+            key: Identifies calls that would produce the same result
+            call: Starts the call when none is running for ``key``
+
+        Returns:
+            The result and whether this caller ran the call. Waiters receive
+            the same object as the caller that ran it.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight), False
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The caller that started it went away; run the call here instead
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the result as retrieved so an unawaited failure is not logged
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._inflight[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        return result, True
@@ -4,22 +4,30 @@ from contextlib import asynccontextmanager, suppress
 import asyncio
 import json
 import logging
-import os
+import random
+from functools import lru_cache
+from pathlib import Path
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 
+from src.agent.action_queue import action_queue
 from src.api.routers import candidates, health, job_descriptions, reports, outlook, interviews, gmail
 from src.config.settings import get_settings
 from src.database.connection import async_session_maker, init_db
+from src.llm.ollama_service import close_http_client
+from src.parsers.resume_parser import shutdown_parser_pool
 from src.services.gmail_activity_log import GmailActivityLog
 from src.services.gmail_sync_service import GmailSyncService
+from src.services.pdf_report import shutdown_pdf_pool
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+_SCHEDULER_MAX_BACKOFF_SECONDS = 3600
+
 
 async def _gmail_scheduler_loop() -> None:
     """Run Gmail sync on configured interval."""
@@ -33,21 +41,30 @@ async def _gmail_scheduler_loop() -> None:
         details={"interval_minutes": interval_minutes},
     )
 
+    failures = 0
     while True:
+        delay = interval_seconds
         try:
-            async with async_session_maker() as session:
-                await GmailSyncService().sync(session, trigger="scheduler")
+            # A hung sync must not hold the scheduler past its next slot
+            async with asyncio.timeout(interval_seconds):
+                async with async_session_maker() as session:
+                    await GmailSyncService().sync(session, trigger="scheduler")
+            failures = 0
         except asyncio.CancelledError:
             raise
         except Exception as exc:
+            failures += 1
+            # Back off exponentially (with jitter) while the sync keeps failing
+            delay = min(interval_seconds * 2**failures, _SCHEDULER_MAX_BACKOFF_SECONDS) + random.uniform(0, 30)
             logger.exception("Scheduled Gmail sync failed")
             GmailActivityLog.add(
                 level="error",
                 action="scheduler_error",
-                message=f"Scheduled Gmail sync failed: {exc}",
+                message=f"Scheduled Gmail sync failed: {exc or type(exc).__name__}",
+                details={"consecutive_failures": failures, "retry_in_seconds": round(delay)},
             )
 
-        await asyncio.sleep(interval_seconds)
+        await asyncio.sleep(delay)
 
 
 @asynccontextmanager
@@ -66,6 +83,10 @@ async def lifespan(app: FastAPI):
             scheduler_task.cancel()
             with suppress(asyncio.CancelledError):
                 await scheduler_task
+        await action_queue.close()
+        shutdown_parser_pool()
+        shutdown_pdf_pool()
+        await close_http_client()
 
 
 app = FastAPI(
@@ -76,13 +97,14 @@ app = FastAPI(
 )
 
 # CORS middleware
-# In production, replace ["*"] with specific allowed origins
+# Explicit origins, methods and headers; preflight responses are cached by the browser
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # TODO: Configure specific origins for production
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=settings.cors_max_age,
 )
 
 # Include routers with /api prefix
@@ -104,41 +126,36 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Mount static files
-# Use current working directory to find static folder
-current_dir = os.path.dirname(os.path.abspath(__file__))
-# Go up 3 levels to reach project root
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-static_dir = os.path.join(project_root, "static")
+# Mount static files from the project root (src/api/app.py -> <root>/static)
+STATIC_DIR = Path(__file__).resolve().parents[2] / "static"
+
 
-print(f"Current directory: {current_dir}")
-print(f"Project root: {project_root}")
-print(f"Static directory: {static_dir}")
-print(f"Static exists: {os.path.exists(static_dir)}")
+@lru_cache(maxsize=1)
+def _static_dir() -> Path:
+    """Resolve the static directory, falling back to ./static for relocated installs."""
+    if STATIC_DIR.is_dir():
+        return STATIC_DIR
+    logger.debug("Static directory not found at %s; using ./static", STATIC_DIR)
+    return Path.cwd() / "static"
 
-if os.path.exists(static_dir):
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
-    print(f"[OK] Static files mounted from: {static_dir}")
+
+if _static_dir().is_dir():
+    app.mount("/static", StaticFiles(directory=_static_dir()), name="static")
 else:
-    print(f"[X] Warning: Static directory not found at: {static_dir}")
-    # Try alternative path
-    alt_static = os.path.join(os.getcwd(), "static")
-    print(f"Trying alternative path: {alt_static}")
-    if os.path.exists(alt_static):
-        app.mount("/static", StaticFiles(directory=alt_static), name="static")
-        print(f"[OK] Static files mounted from: {alt_static}")
+    logger.warning("Static directory not found: %s", _static_dir())
+
+INDEX_PATH = _static_dir() / "index.html"
+_INDEX_EXISTS = INDEX_PATH.is_file()
+if not _INDEX_EXISTS:
+    logger.warning("UI index not found: %s", INDEX_PATH)
 
 
 @app.get("/")
 async def root():
     """Root endpoint - redirect to UI."""
-    # Use the working directory to find static files
-    alt_static = os.path.join(os.getcwd(), "static")
-    if os.path.exists(alt_static):
-        return FileResponse(os.path.join(alt_static, "index.html"))
-    else:
-        # Fallback to original static_dir
-        return FileResponse(os.path.join(static_dir, "index.html"))
+    if not _INDEX_EXISTS:
+        return JSONResponse(status_code=404, content={"detail": "UI not found"})
+    return FileResponse(INDEX_PATH)
 
 
 @app.get("/api")
@@ -164,6 +181,15 @@ async def api_info():
 async def frontend_config(request: Request) -> Response:
     """Return frontend configuration as JavaScript."""
     base_url = settings.api_base_url or str(request.base_url).rstrip("/")
+    return Response(
+        content=_config_script(base_url),
+        media_type="application/javascript",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
+
+
+@lru_cache(maxsize=8)
+def _config_script(base_url: str) -> bytes:
+    """Encode the frontend config script for a base URL."""
     payload = {"API_BASE_URL": base_url}
-    script = f"window.APP_CONFIG = {json.dumps(payload)};"
-    return Response(content=script, media_type="application/javascript")
+    return f"window.APP_CONFIG = {json.dumps(payload)};".encode("utf-8")
@@ -1,27 +1,42 @@
 """Router for candidate endpoints."""
 
+import asyncio
 import base64
-from io import BytesIO
+import hashlib
+import itertools
+import json
 import re
 import os
+import tempfile
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Annotated
+from urllib.parse import quote
 from zipfile import ZIP_DEFLATED, ZipFile
 
+import aiofiles
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
-from fastapi.responses import StreamingResponse
-from sqlalchemy import and_, func, or_, select
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from sqlalchemy import and_, delete, func, literal, or_, select, union
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload, load_only, selectinload
 
-from src.agent.hiring_agent import HiringAgent
+from src.agent.hiring_agent import HiringAgent, get_hiring_agent
+from src.agent.single_flight import SingleFlight
 from src.api.schemas import (
     CandidateCreate,
     CandidateCreateFromFile,
     CandidateResponse,
+    CandidateListItemResponse,
     CandidateDetailResponse,
+    CandidateLinkRequest,
+    CandidateSelectionRequest,
     CandidateWithAnalysisResponse,
     ErrorResponse,
 )
+from src.config.settings import get_settings
 from src.database.connection import get_db
 from src.database.models import (
     Candidate,
@@ -29,46 +44,116 @@ from src.database.models import (
     CandidateAnalysisRun,
     CandidateJobLink,
     CandidateProfile,
+    InterviewFeedback,
+    InterviewQuestion,
+    InterviewResponse,
+    InterviewSession,
     JobDescription,
+    candidate_profiles_fts,
+    candidates_fts,
 )
-from src.llm.ollama_service import OllamaService
+from src.llm.ollama_service import OllamaService, get_ollama_service
 from src.parsers.resume_parser import ResumeParser
-from src.services.pdf_report import build_candidate_analysis_pdf
+from src.services.pdf_report import build_candidate_analysis_pdf_async
 
 router = APIRouter(prefix="/candidates", tags=["Candidates"])
 
 RESUME_DIR = os.path.join("data", "resumes")
 os.makedirs(RESUME_DIR, exist_ok=True)
 
+# Uploads are copied to disk in chunks of this size rather than read whole
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+# Rows per multi-row link INSERT, well under SQLite's bound-parameter limit
+_LINK_INSERT_CHUNK_SIZE = 500
+# Candidate ids per set-based DELETE batch
+_DELETE_CHUNK_SIZE = 5000
+# Candidates deleted per committed transaction by clear-all
+_CLEAR_ALL_CHUNK_SIZE = 1000
+# Threads used to remove resume files after bulk deletes
+_UNLINK_WORKERS = 8
+# Per-process sequence number appended to stored resume file names
+_resume_file_seq = itertools.count()
+# Candidate columns read by CandidateResponse; everything else is left unloaded
+_CANDIDATE_RESPONSE_COLUMNS = tuple(getattr(Candidate, name) for name in CandidateResponse.model_fields)
+# How long a /summary/paged total_count is reused for the same filters
+_SUMMARY_COUNT_TTL_SECONDS = 30.0
+# Cached totals keyed by the normalized filters, as (expires_at, count)
+_summary_counts: dict[tuple, tuple[float, int]] = {}
+_summary_count_locks: dict[tuple, asyncio.Lock] = {}
+# Term index for auto-linking resumes to JDs, keyed by the JD catalog version
+_jd_match_indexes: dict[tuple, tuple[tuple[str, ...], dict[str, list[tuple[int, int]]]]] = {}
+# Analyze requests currently running, keyed by (candidate_id, job_description_id)
+_analysis_inflight = SingleFlight()
+# Name extraction only looks at the resume header
+_NAME_SCAN_CHARS = 2048
+
+_SAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9_-]+")
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_PHONE_RE = re.compile(r"(\+?\d[\d\s\-\(\)]{8,}\d)")
+_NAME_SEPARATOR_RE = re.compile(r"[\|/\\\\]+")
+_NAME_INVALID_CHARS_RE = re.compile(r"[^A-Za-z\s\.\-']")
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+_NAME_LABEL_RE = re.compile(r"^name\s*[:\-]", re.IGNORECASE)
+_NAME_LABEL_STRIP_RE = re.compile(r"^name\s*[:\-]\s*", re.IGNORECASE)
+_NAME_SPLIT_MARKERS_RE = re.compile(r"\s[-–]\s|\|")
+_NAME_SKIP_LINE_RE = re.compile(r"http|resume|curriculum|cv", re.IGNORECASE)
+_NAME_SECTION_MARKER_RE = re.compile(r"personal profile|profile|summary", re.IGNORECASE)
+_INVALID_NAME_LITERALS = frozenset({"cv", "resume", "curriculum vitae"})
+_INVALID_NAME_KEYWORDS_RE = re.compile(r"profile|summary|experience|education|skills", re.IGNORECASE)
+_RESUME_KEYWORDS_RE = re.compile(r"experience|education|skills|project|responsibilities|summary", re.IGNORECASE)
+
+
+class _ZipStreamBuffer:
+    """Write-only file object that lets ZipFile output be streamed in chunks.
+
+    It has no ``tell``/``seek``, so ZipFile writes in streaming mode and each
+    member can be sent as soon as it has been added.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Return and clear everything written so far."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
 
 def _safe_filename(value: str) -> str:
-    name = re.sub(r"[^A-Za-z0-9_-]+", "_", value.strip())
+    name = _SAFE_FILENAME_RE.sub("_", value.strip())
     return name.strip("_") or "candidate"
 
 
 def _extract_email(text: str) -> str | None:
-    match = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else None
 
 
 def _extract_phone(text: str) -> str | None:
-    match = re.search(r"(\+?\d[\d\s\-\(\)]{8,}\d)", text)
+    match = _PHONE_RE.search(text)
     return match.group(0) if match else None
 
 
 def _normalize_name(value: str) -> str:
-    cleaned = re.sub(r"[\|/\\\\]+", " ", value or "")
-    cleaned = re.sub(r"[^A-Za-z\s\.\-']", " ", cleaned).strip()
-    return re.sub(r"\s{2,}", " ", cleaned).strip()
+    cleaned = _NAME_SEPARATOR_RE.sub(" ", value or "")
+    cleaned = _NAME_INVALID_CHARS_RE.sub(" ", cleaned).strip()
+    return _MULTISPACE_RE.sub(" ", cleaned).strip()
 
 
 def _is_valid_name(value: str) -> bool:
     if not value:
         return False
-    lowered = value.lower()
-    if lowered in {"cv", "resume", "curriculum vitae"}:
+    if value.lower() in _INVALID_NAME_LITERALS:
         return False
-    if any(keyword in lowered for keyword in ("profile", "summary", "experience", "education", "skills")):
+    if _INVALID_NAME_KEYWORDS_RE.search(value):
         return False
     parts = value.split()
     if len(parts) < 2 or len(parts) > 5:
@@ -81,45 +166,43 @@ def _is_valid_name(value: str) -> bool:
 def _extract_name(text: str) -> str | None:
     if not text:
         return None
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    if not lines:
-        return None
-
-    # Prefer explicit name labels.
-    for line in lines[:30]:
-        if re.match(r"^name\s*[:\-]", line, flags=re.IGNORECASE):
-            candidate = _normalize_name(re.sub(r"^name\s*[:\-]\s*", "", line, flags=re.IGNORECASE))
-            candidate = candidate.split(" - ")[0].split(" – ")[0].split("|")[0].strip()
+    # The name lives in the header, so only the first lines are ever examined.
+    lines = [line.strip() for line in text[:_NAME_SCAN_CHARS].splitlines() if line.strip()][:30]
+
+    fallback = None
+    for line in lines:
+        # Prefer explicit name labels.
+        if _NAME_LABEL_RE.match(line):
+            candidate = _normalize_name(_NAME_LABEL_STRIP_RE.sub("", line))
+            candidate = _NAME_SPLIT_MARKERS_RE.split(candidate, maxsplit=1)[0].strip()
             if _is_valid_name(candidate):
                 return candidate
-
-    # Heuristic: first clean line without emails/urls/section headers.
-    for line in lines[:30]:
-        lowered = line.lower()
-        if "@" in line or "http" in lowered:
+        if fallback is not None:
             continue
-        if any(keyword in lowered for keyword in ("resume", "curriculum", "cv")):
+
+        # Heuristic: first clean line without emails/urls/section headers.
+        if "@" in line or _NAME_SKIP_LINE_RE.search(line):
             continue
-        candidate = line
-        if "|" in candidate or " - " in candidate or " – " in candidate:
-            candidate = candidate.split(" - ")[0].split(" – ")[0].split("|")[0].strip()
-        for marker in ("personal profile", "profile", "summary"):
-            idx = candidate.lower().find(marker)
-            if idx > 0:
-                candidate = candidate[:idx].strip()
-                break
+        candidate = _NAME_SPLIT_MARKERS_RE.split(line, maxsplit=1)[0].strip()
+        marker = _NAME_SECTION_MARKER_RE.search(candidate, 1)
+        if marker:
+            candidate = candidate[: marker.start()].strip()
         candidate = _normalize_name(candidate)
         if _is_valid_name(candidate):
-            return candidate
-    return None
+            fallback = candidate
+    return fallback
 
 
 def _is_likely_resume(text: str) -> bool:
     if not text or len(text) < 200:
         return False
-    keywords = ["experience", "education", "skills", "project", "responsibilities", "summary"]
-    found = sum(1 for keyword in keywords if keyword in text.lower())
-    return found >= 2
+    # Stop scanning as soon as two distinct section keywords have been seen
+    found = set()
+    for match in _RESUME_KEYWORDS_RE.finditer(text):
+        found.add(match.group(0).lower())
+        if len(found) >= 2:
+            return True
+    return False
 
 
 def _apply_candidate_filters(
@@ -137,19 +220,40 @@ def _apply_candidate_filters(
         query = query.outerjoin(CandidateJobLink, Candidate.id == CandidateJobLink.candidate_id)
         query = query.where(CandidateJobLink.job_description_id == job_description_id)
     if name:
-        query = query.where(Candidate.name.ilike(f"%{name}%"))
+        query = query.where(
+            Candidate.id.in_(select(candidates_fts.c.rowid).where(candidates_fts.c.name.like(f"%{name}%")))
+        )
     if min_experience is not None:
         query = query.where(CandidateProfile.total_experience_years >= min_experience)
     if max_experience is not None:
         query = query.where(CandidateProfile.total_experience_years <= max_experience)
     if skills:
-        skill_terms = [term.strip().lower() for term in skills.split(",") if term.strip()]
-        for term in skill_terms:
+        skill_terms = list(dict.fromkeys(term.strip().lower() for term in skills.split(",") if term.strip()))
+        if skill_terms:
+            # Tag every candidate matching each term, then keep candidates that matched all
+            # of them: one predicate however many terms there are. Each branch is a trigram
+            # index lookup rather than a scan of profiles or resumes.
+            term_matches = []
+            for index, term in enumerate(skill_terms):
+                pattern = f"%{term}%"
+                profile_ids = union(
+                    select(candidate_profiles_fts.c.rowid).where(candidate_profiles_fts.c.primary_skills.like(pattern)),
+                    select(candidate_profiles_fts.c.rowid).where(candidate_profiles_fts.c.secondary_skills.like(pattern)),
+                )
+                term_matches.append(
+                    select(CandidateProfile.candidate_id.label("candidate_id"), literal(index).label("term"))
+                    .where(CandidateProfile.id.in_(profile_ids))
+                )
+                term_matches.append(
+                    select(candidates_fts.c.rowid.label("candidate_id"), literal(index).label("term"))
+                    .where(candidates_fts.c.resume_text.like(pattern))
+                )
+            matches = union(*term_matches).subquery()
             query = query.where(
-                or_(
-                    CandidateProfile.primary_skills.like(f"%{term}%"),
-                    CandidateProfile.secondary_skills.like(f"%{term}%"),
-                    Candidate.resume_text.ilike(f"%{term}%"),
+                Candidate.id.in_(
+                    select(matches.c.candidate_id)
+                    .group_by(matches.c.candidate_id)
+                    .having(func.count(func.distinct(matches.c.term)) == len(skill_terms))
                 )
             )
     if created_from:
@@ -173,61 +277,69 @@ def _decode_candidate_cursor(cursor: str) -> tuple[datetime, int]:
         raise HTTPException(status_code=400, detail="Invalid cursor") from exc
 
 
-async def _build_candidate_summary_items(rows: list[tuple], db: AsyncSession) -> list[dict]:
-    candidate_ids = [candidate.id for candidate, _ in rows]
-    link_map: dict[int, list[dict]] = {}
-    latest_analysis_map: dict[int, dict] = {}
-
-    if candidate_ids:
-        links_result = await db.execute(
-            select(CandidateJobLink, JobDescription)
-            .join(JobDescription, CandidateJobLink.job_description_id == JobDescription.id)
-            .where(CandidateJobLink.candidate_id.in_(candidate_ids))
-        )
-        for link, jd in links_result.all():
-            link_map.setdefault(link.candidate_id, []).append(
-                {
-                    "job_description_id": jd.id,
-                    "title": jd.title,
-                    "confidence": link.confidence,
-                }
-            )
-
-        runs_result = await db.execute(
-            select(CandidateAnalysisRun, JobDescription)
-            .join(JobDescription, CandidateAnalysisRun.job_description_id == JobDescription.id)
-            .where(CandidateAnalysisRun.candidate_id.in_(candidate_ids))
-            .order_by(
-                CandidateAnalysisRun.candidate_id,
-                CandidateAnalysisRun.analysis_timestamp.desc(),
-                CandidateAnalysisRun.id.desc(),
+def _candidate_summary_query():
+    """Select candidates with their profile, latest analysis run and JD links in one query."""
+    latest_run_id = (
+        select(CandidateAnalysisRun.id)
+        .join(JobDescription, CandidateAnalysisRun.job_description_id == JobDescription.id)
+        .where(CandidateAnalysisRun.candidate_id == Candidate.id)
+        .order_by(CandidateAnalysisRun.analysis_timestamp.desc(), CandidateAnalysisRun.id.desc())
+        .limit(1)
+        .correlate(Candidate)
+        .scalar_subquery()
+    )
+    job_links = (
+        select(
+            func.json_group_array(
+                func.json_object(
+                    "job_description_id",
+                    JobDescription.id,
+                    "title",
+                    JobDescription.title,
+                    "confidence",
+                    CandidateJobLink.confidence,
+                )
             )
         )
-        for run, jd in runs_result.all():
-            if run.candidate_id in latest_analysis_map:
-                continue
-            payload = run.to_dict()
-            payload["job_description_title"] = jd.title
-            latest_analysis_map[run.candidate_id] = payload
+        .select_from(CandidateJobLink)
+        .join(JobDescription, CandidateJobLink.job_description_id == JobDescription.id)
+        .where(CandidateJobLink.candidate_id == Candidate.id)
+        .correlate(Candidate)
+        .scalar_subquery()
+    )
+    run_jd = aliased(JobDescription)
+    return (
+        select(Candidate, CandidateProfile, CandidateAnalysisRun, run_jd.title, job_links)
+        .outerjoin(CandidateProfile, Candidate.id == CandidateProfile.candidate_id)
+        .outerjoin(CandidateAnalysisRun, CandidateAnalysisRun.id == latest_run_id)
+        .outerjoin(run_jd, CandidateAnalysisRun.job_description_id == run_jd.id)
+        .order_by(Candidate.created_at.desc(), Candidate.id.desc())
+    )
 
-    return [
-        {
-            "candidate": candidate.to_dict(),
-            "profile": profile.to_dict() if profile else None,
-            "job_links": link_map.get(candidate.id, []),
-            "latest_analysis": latest_analysis_map.get(candidate.id),
-        }
-        for candidate, profile in rows
-    ]
 
+def _build_candidate_summary_items(rows: list[tuple]) -> list[dict]:
+    items = []
+    for candidate, profile, run, run_jd_title, job_links in rows:
+        latest_analysis = None
+        if run is not None:
+            latest_analysis = run.to_dict()
+            latest_analysis["job_description_title"] = run_jd_title
+        items.append(
+            {
+                "candidate": candidate.to_dict(),
+                "profile": profile.to_dict() if profile else None,
+                "job_links": json.loads(job_links) if job_links else [],
+                "latest_analysis": latest_analysis,
+            }
+        )
+    return items
 
-async def _build_profile(
-    candidate_id: int,
+
+async def _extract_profile_data(
     resume_text: str,
     ollama: OllamaService,
     invalid_resume: bool,
-    db: AsyncSession,
-) -> CandidateProfile:
+) -> dict:
     profile_data = {
         "current_role": None,
         "headline": None,
@@ -271,57 +383,202 @@ async def _build_profile(
             level = "Senior" if experience >= 7 else "Mid-level" if experience >= 3 else "Junior"
             headline = f"{level} {primary_skills[0]} Developer" if primary_skills else f"{level} Developer"
         profile_data["headline"] = headline
+    return profile_data
 
+
+async def _build_profile(
+    candidate_id: int,
+    resume_text: str,
+    ollama: OllamaService,
+    invalid_resume: bool,
+    db: AsyncSession,
+) -> CandidateProfile:
+    profile_data = await _extract_profile_data(resume_text, ollama, invalid_resume)
     profile = CandidateProfile(candidate_id=candidate_id, **profile_data)
     db.add(profile)
     return profile
 
 
-def _save_resume_file(filename: str, content: bytes, candidate_name: str) -> str:
+def _resume_file_path(filename: str, candidate_name: str) -> str:
     safe_name = _safe_filename(candidate_name)
     ext = os.path.splitext(filename or "")[1] or ".txt"
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    stored_name = f"{safe_name}_{timestamp}{ext}"
-    path = os.path.join(RESUME_DIR, stored_name)
-    with open(path, "wb") as f:
-        f.write(content)
+    # The counter keeps files stored within the same clock tick from overwriting each other
+    stored_name = f"{safe_name}_{time.time_ns()}_{next(_resume_file_seq)}{ext}"
+    return os.path.join(RESUME_DIR, stored_name)
+
+
+async def _save_resume_file(filename: str, content: bytes, candidate_name: str) -> str:
+    path = _resume_file_path(filename, candidate_name)
+    async with aiofiles.open(path, "wb") as f:
+        await f.write(content)
     return path
 
 
-async def _auto_link_candidate_to_jds(
-    db: AsyncSession,
-    candidate_id: int,
+def _resume_digest(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+async def _stage_upload(file: UploadFile, filename: str) -> tuple[str, str]:
+    """Stream an upload into a temporary file in RESUME_DIR, hashing it chunk by chunk."""
+    ext = os.path.splitext(filename or "")[1]
+    fd, path = tempfile.mkstemp(dir=RESUME_DIR, prefix=".upload-", suffix=ext)
+    os.close(fd)
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        await file.seek(0)
+        async with aiofiles.open(path, "wb") as f:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path, digest.hexdigest()
+
+
+async def _job_description_exists(db: AsyncSession, job_description_id: int) -> bool:
+    """Check for a job description without loading its text columns."""
+    result = await db.execute(
+        select(literal(1)).where(JobDescription.id == job_description_id).limit(1)
+    )
+    return result.scalar() is not None
+
+
+def _remove_files(paths: list[str]) -> int:
+    """Unlink files, skipping ones that are already gone, and return how many were removed."""
+    removed = 0
+    for path in paths:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+async def _unlink_many(paths: list[str]) -> int:
+    """Remove files in parallel worker threads and return how many were removed."""
+    if not paths:
+        return 0
+    # A few threads each take a slice, rather than one thread hop per file
+    workers = min(_UNLINK_WORKERS, len(paths))
+    counts = await asyncio.gather(
+        *(asyncio.to_thread(_remove_files, paths[i::workers]) for i in range(workers))
+    )
+    return sum(counts)
+
+
+def _store_staged_resume(staged_path: str, filename: str, candidate_name: str) -> str:
+    path = _resume_file_path(filename, candidate_name)
+    os.replace(staged_path, path)
+    return path
+
+
+async def _jd_match_index(db: AsyncSession) -> tuple[tuple[str, ...], dict[str, list[tuple[int, int]]]]:
+    """Return every JD match term and, per term, the (jd_id, weight) pairs it scores for.
+
+    Skills weigh 2 and titles and domains 1. The index is rebuilt only when
+    the JD catalog changes, which a count/max(updated_at) probe detects
+    without reading the skill lists.
+    """
+    version = tuple(
+        (
+            await db.execute(
+                select(func.count(JobDescription.id), func.max(JobDescription.updated_at))
+            )
+        ).one()
+    )
+    cached = _jd_match_indexes.get(version)
+    if cached is not None:
+        return cached
+
+    jd_result = await db.execute(
+        select(
+            JobDescription.id,
+            JobDescription.title,
+            JobDescription.domain,
+            JobDescription.required_skills,
+        ).order_by(JobDescription.id)
+    )
+    index: dict[str, list[tuple[int, int]]] = {}
+    for jd_id, title, domain, required_skills in jd_result.all():
+        weighted = [(skill.lower(), 2) for skill in required_skills or () if skill]
+        weighted += [((title or "").lower(), 1), ((domain or "").lower(), 1)]
+        for term, weight in weighted:
+            if term:
+                index.setdefault(term, []).append((jd_id, weight))
+
+    cached = (tuple(sorted(index)), index)
+    _jd_match_indexes.clear()
+    _jd_match_indexes[version] = cached
+    return cached
+
+
+@lru_cache(maxsize=8)
+def _term_automaton(terms: tuple[str, ...]):
+    """Build an Aho-Corasick automaton over the terms, or None without pyahocorasick.
+
+    Keyed by the sorted term set, so adding or editing a JD simply builds a new one.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_terms(text: str, terms: tuple[str, ...]) -> set[str]:
+    """Return the terms that occur anywhere in the text as substrings."""
+    if not terms:
+        return set()
+    automaton = _term_automaton(terms)
+    if automaton is None:
+        return {term for term in terms if term in text}
+    return {term for _, term in automaton.iter(text)}
+
+
+def _score_jd_links(
     resume_text: str,
+    match_index: tuple[tuple[str, ...], dict[str, list[tuple[int, int]]]],
     max_links: int = 3,
-) -> list[CandidateJobLink]:
-    jd_result = await db.execute(select(JobDescription))
-    jds = list(jd_result.scalars().all())
-    if not jds:
+) -> list[tuple[int, float]]:
+    """Return the (jd_id, confidence) pairs a resume should be auto-linked to."""
+    terms, index = match_index
+    if not terms:
         return []
 
-    resume_lower = (resume_text or "").lower()
-    scored: list[tuple[JobDescription, float]] = []
-    for jd in jds:
-        required_skills = [skill.lower() for skill in (jd.required_skills or [])]
-        skill_matches = sum(1 for skill in required_skills if skill and skill in resume_lower)
-        title_hit = 1 if jd.title and jd.title.lower() in resume_lower else 0
-        domain_hit = 1 if jd.domain and jd.domain.lower() in resume_lower else 0
-        score = skill_matches * 2 + title_hit + domain_hit
-        if score > 0:
-            scored.append((jd, float(score)))
-
-    scored.sort(key=lambda item: item[1], reverse=True)
-    if not scored:
+    # Every distinct term across all JDs is matched in one scan of the resume,
+    # and only the JDs sharing a matched term are scored
+    scores: dict[int, int] = {}
+    for term in _find_terms((resume_text or "").lower(), terms):
+        for jd_id, weight in index[term]:
+            scores[jd_id] = scores.get(jd_id, 0) + weight
+    if not scores:
         return []
 
+    scored = [(jd_id, float(score)) for jd_id, score in sorted(scores.items(), key=lambda item: (-item[1], item[0]))]
     best_score = scored[0][1]
-    selected = [item for item in scored if item[1] >= best_score - 1][:max_links]
+    return [item for item in scored if item[1] >= best_score - 1][:max_links]
+
+
+async def _auto_link_candidate_to_jds(
+    db: AsyncSession,
+    candidate_id: int,
+    resume_text: str,
+    max_links: int = 3,
+) -> list[CandidateJobLink]:
+    selected = _score_jd_links(resume_text, await _jd_match_index(db), max_links)
 
     links: list[CandidateJobLink] = []
-    for jd, score in selected:
+    for jd_id, score in selected:
         link = CandidateJobLink(
             candidate_id=candidate_id,
-            job_description_id=jd.id,
+            job_description_id=jd_id,
             confidence=score,
             linked_by="ai",
         )
@@ -335,20 +592,21 @@ async def _find_duplicate_candidate(
     db: AsyncSession,
     name: str,
     email: str | None,
-) -> Candidate | None:
+) -> int | None:
     if not name:
         return None
-    query = select(Candidate).where(Candidate.name.ilike(name))
+    # Matches the (lower(name), lower(email)) expression index on candidates
+    query = select(Candidate.id).where(func.lower(Candidate.name) == name.lower())
     if email:
-        query = query.where(Candidate.email.ilike(email))
-    result = await db.execute(query)
+        query = query.where(func.lower(Candidate.email) == email.lower())
+    result = await db.execute(query.limit(1))
     return result.scalar_one_or_none()
 
 
 async def create_candidate_from_resume_bytes(
     db: AsyncSession,
     filename: str,
-    content: bytes,
+    content: bytes | UploadFile,
     *,
     name: str | None = None,
     email: str | None = None,
@@ -357,43 +615,63 @@ async def create_candidate_from_resume_bytes(
     ollama: OllamaService | None = None,
 ) -> Candidate | None:
     """
-    Create a candidate from raw resume bytes using the same logic as upload flow.
+    Create a candidate from raw resume bytes or an upload using the same logic as upload flow.
 
     Returns None when a duplicate candidate is detected.
     Raises ValueError for unsupported/invalid resume files.
     """
     if job_description_id is not None:
-        jd_result = await db.execute(
-            select(JobDescription).where(JobDescription.id == job_description_id)
-        )
-        if not jd_result.scalar_one_or_none():
+        if not await _job_description_exists(db, job_description_id):
             raise ValueError("Job description not found")
 
-    parser = ResumeParser()
-    resume_text = parser.parse_and_clean(filename, content)
-    invalid_resume = not _is_likely_resume(resume_text)
-    extracted_name = _extract_name(resume_text)
-    resolved_name = (name or "").strip() or extracted_name
+    # Uploads are streamed to disk and parsed from there instead of read into memory
+    if isinstance(content, bytes):
+        staged_path, resume_hash = None, _resume_digest(content)
+    else:
+        staged_path, resume_hash = await _stage_upload(content, filename)
+    try:
+        # The same file was uploaded before: skip parsing and the LLM calls entirely
+        existing = await db.execute(
+            select(Candidate.id).where(Candidate.resume_hash == resume_hash).limit(1)
+        )
+        if existing.scalar_one_or_none() is not None:
+            return None
+
+        if staged_path is not None:
+            resume_text = await ResumeParser.parse_and_clean_async(staged_path)
+        else:
+            resume_text = await ResumeParser.parse_and_clean_async(filename, content)
+        invalid_resume = not _is_likely_resume(resume_text)
+        extracted_name = _extract_name(resume_text)
+        resolved_name = (name or "").strip() or extracted_name
 
-    llm = ollama or OllamaService()
-    if resume_text and (not resolved_name or not _is_valid_name(resolved_name)):
-        try:
-            first_lines = "\n".join(
-                [line for line in (resume_text or "").splitlines() if line.strip()][:20]
-            )
-            llm_name = await llm.extract_candidate_name(first_lines or resume_text)
-            resolved_name = _normalize_name((llm_name or {}).get("name"))
-            if not _is_valid_name(resolved_name):
+        llm = ollama or get_ollama_service()
+        if resume_text and (not resolved_name or not _is_valid_name(resolved_name)):
+            try:
+                first_lines = "\n".join(
+                    [line for line in (resume_text or "").splitlines() if line.strip()][:20]
+                )
+                llm_name = await llm.extract_candidate_name(first_lines or resume_text)
+                resolved_name = _normalize_name((llm_name or {}).get("name"))
+                if not _is_valid_name(resolved_name):
+                    resolved_name = None
+            except Exception:
                 resolved_name = None
-        except Exception:
-            resolved_name = None
 
-    if not resolved_name or not _is_valid_name(resolved_name):
-        resolved_name = _normalize_name(os.path.splitext(filename or "")[0])
-    if not resolved_name or not _is_valid_name(resolved_name):
-        resolved_name = "Candidate"
+        if not resolved_name or not _is_valid_name(resolved_name):
+            resolved_name = _normalize_name(os.path.splitext(filename or "")[0])
+        if not resolved_name or not _is_valid_name(resolved_name):
+            resolved_name = "Candidate"
+
+        if staged_path is not None:
+            stored_path = _store_staged_resume(staged_path, filename, resolved_name)
+        else:
+            stored_path = await _save_resume_file(filename, content, resolved_name)
+    finally:
+        # Already moved into place unless parsing failed
+        if staged_path is not None:
+            _remove_files([staged_path])
 
-    stored_path = _save_resume_file(filename, content, resolved_name)
     resolved_email = email or _extract_email(resume_text)
     resolved_phone = phone or _extract_phone(resume_text)
 
@@ -407,6 +685,7 @@ async def create_candidate_from_resume_bytes(
         phone=resolved_phone,
         resume_text=resume_text,
         resume_file_path=stored_path,
+        resume_hash=resume_hash,
         job_description_id=job_description_id,
     )
     db.add(candidate)
@@ -426,7 +705,7 @@ async def create_candidate_from_resume_bytes(
         await _auto_link_candidate_to_jds(db, candidate.id, resume_text)
 
     await db.commit()
-    await db.refresh(candidate)
+    _summary_counts.clear()
     return candidate
 
 
@@ -434,6 +713,7 @@ async def create_candidate_from_resume_bytes(
 async def create_candidate(
     candidate_data: CandidateCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
+    ollama: Annotated[OllamaService, Depends(get_ollama_service)],
 ) -> Candidate:
     """
     Create a new candidate from resume text.
@@ -450,10 +730,7 @@ async def create_candidate(
     """
     # Verify job description if provided
     if candidate_data.job_description_id is not None:
-        jd_result = await db.execute(
-            select(JobDescription).where(JobDescription.id == candidate_data.job_description_id)
-        )
-        if not jd_result.scalar_one_or_none():
+        if not await _job_description_exists(db, candidate_data.job_description_id):
             raise HTTPException(status_code=404, detail="Job description not found")
 
     duplicate = await _find_duplicate_candidate(db, candidate_data.name, candidate_data.email)
@@ -470,7 +747,6 @@ async def create_candidate(
     db.add(candidate)
     await db.flush()
     invalid_resume = not _is_likely_resume(candidate_data.resume_text)
-    ollama = OllamaService()
     await _build_profile(candidate.id, candidate_data.resume_text, ollama, invalid_resume, db)
     if candidate_data.job_description_id is not None:
         db.add(
@@ -482,13 +758,14 @@ async def create_candidate(
             )
         )
     await db.commit()
-    await db.refresh(candidate)
+    _summary_counts.clear()
     return candidate.to_dict()
 
 
 @router.post("/upload", response_model=CandidateResponse, status_code=201)
 async def upload_candidate_resume(
     db: Annotated[AsyncSession, Depends(get_db)],
+    ollama: Annotated[OllamaService, Depends(get_ollama_service)],
     name: Annotated[str | None, Form()] = None,
     job_description_id: Annotated[int | None, Form()] = None,
     email: Annotated[str | None, Form()] = None,
@@ -512,17 +789,16 @@ async def upload_candidate_resume(
     Raises:
         HTTPException: If job description not found or file format not supported
     """
-    content = await file.read()
     try:
         candidate = await create_candidate_from_resume_bytes(
             db=db,
             filename=file.filename or "resume.txt",
-            content=content,
+            content=file,
             name=name,
             email=email,
             phone=phone,
             job_description_id=job_description_id,
-            ollama=OllamaService(),
+            ollama=ollama,
         )
     except ValueError as e:
         detail = str(e)
@@ -531,12 +807,12 @@ async def upload_candidate_resume(
         raise HTTPException(status_code=400, detail=detail)
 
     if candidate is None:
-        raise HTTPException(status_code=409, detail="Candidate already exists with same name and email")
+        raise HTTPException(status_code=409, detail="Candidate already exists with the same resume file, or same name and email")
 
     return candidate.to_dict()
 
 
-@router.get("", response_model=list[CandidateResponse])
+@router.get("", response_model=list[CandidateListItemResponse])
 async def list_candidates(
     db: Annotated[AsyncSession, Depends(get_db)],
     job_description_id: int | None = None,
@@ -548,7 +824,7 @@ async def list_candidates(
     created_to: str | None = None,
     skip: Annotated[int, Query] = 0,
     limit: Annotated[int, Query] = 100,
-) -> list[Candidate]:
+) -> list[dict]:
     """
     List candidates, optionally filtered by job description.
 
@@ -561,8 +837,17 @@ async def list_candidates(
     Returns:
         List of candidates
     """
+    # Project only the listed columns so resume_text is never loaded
     query = (
-        select(Candidate)
+        select(
+            Candidate.id,
+            Candidate.name,
+            Candidate.email,
+            Candidate.phone,
+            Candidate.resume_file_path,
+            Candidate.job_description_id,
+            Candidate.created_at,
+        )
         .outerjoin(CandidateProfile, Candidate.id == CandidateProfile.candidate_id)
         .order_by(Candidate.created_at.desc())
     )
@@ -580,8 +865,12 @@ async def list_candidates(
     query = query.offset(skip).limit(limit)
 
     result = await db.execute(query)
-    candidates = list(result.scalars().all())
-    return [candidate.to_dict() for candidate in candidates]
+    items = []
+    for row in result.mappings():
+        item = dict(row)
+        item["created_at"] = row["created_at"].isoformat() if row["created_at"] else None
+        items.append(item)
+    return items
 
 
 @router.get("/summary")
@@ -598,11 +887,7 @@ async def list_candidates_summary(
     limit: Annotated[int, Query] = 100,
 ) -> list[dict]:
     """List candidates with profile summary for management screens."""
-    query = (
-        select(Candidate, CandidateProfile)
-        .outerjoin(CandidateProfile, Candidate.id == CandidateProfile.candidate_id)
-        .order_by(Candidate.created_at.desc(), Candidate.id.desc())
-    )
+    query = _candidate_summary_query()
     query = _apply_candidate_filters(
         query,
         job_description_id=job_description_id,
@@ -617,7 +902,7 @@ async def list_candidates_summary(
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
     rows = result.all()
-    return await _build_candidate_summary_items(rows, db)
+    return _build_candidate_summary_items(rows)
 
 
 @router.get("/summary/paged")
@@ -632,14 +917,15 @@ async def list_candidates_summary_paged(
     created_to: str | None = None,
     limit: Annotated[int, Query] = 20,
     cursor: str | None = None,
+    include_total: bool = False,
 ) -> dict:
-    """Cursor-paged candidate summary for high-volume management screens."""
+    """Cursor-paged candidate summary for high-volume management screens.
+
+    ``total_count`` is only computed when ``include_total`` is set, and is
+    then reused for identical filters for a short while.
+    """
     page_limit = max(1, min(limit, 100))
-    query = (
-        select(Candidate, CandidateProfile)
-        .outerjoin(CandidateProfile, Candidate.id == CandidateProfile.candidate_id)
-        .order_by(Candidate.created_at.desc(), Candidate.id.desc())
-    )
+    query = _candidate_summary_query()
     query = _apply_candidate_filters(
         query,
         job_description_id=job_description_id,
@@ -664,39 +950,66 @@ async def list_candidates_summary_paged(
     rows = result.all()
     has_more = len(rows) > page_limit
     page_rows = rows[:page_limit]
-    items = await _build_candidate_summary_items(page_rows, db)
+    items = _build_candidate_summary_items(page_rows)
 
     next_cursor = None
     if has_more and page_rows:
         last_candidate = page_rows[-1][0]
         next_cursor = _encode_candidate_cursor(last_candidate.created_at, last_candidate.id)
 
-    count_query = (
-        select(func.count(func.distinct(Candidate.id)))
-        .select_from(Candidate)
-        .outerjoin(CandidateProfile, Candidate.id == CandidateProfile.candidate_id)
-    )
-    count_query = _apply_candidate_filters(
-        count_query,
-        job_description_id=job_description_id,
-        name=name,
-        skills=skills,
-        min_experience=min_experience,
-        max_experience=max_experience,
-        created_from=created_from,
-        created_to=created_to,
-    )
-    total_count = (await db.execute(count_query)).scalar_one() or 0
+    total_count = None
+    if include_total:
+        total_count = await _count_summary_candidates(
+            db,
+            job_description_id=job_description_id,
+            name=name,
+            skills=skills,
+            min_experience=min_experience,
+            max_experience=max_experience,
+            created_from=created_from,
+            created_to=created_to,
+        )
 
     return {
         "items": items,
         "next_cursor": next_cursor,
         "has_more": has_more,
         "limit": page_limit,
-        "total_count": int(total_count),
+        "total_count": total_count,
     }
 
 
+async def _count_summary_candidates(db: AsyncSession, **filters) -> int:
+    """Count candidates matching the summary filters, reusing recent results."""
+    key = tuple(sorted(filters.items()))
+    cached = _summary_counts.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    # Concurrent requests for the same filters wait for one COUNT instead of each running it
+    lock = _summary_count_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        try:
+            cached = _summary_counts.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+            count_query = select(func.count(func.distinct(Candidate.id))).select_from(Candidate)
+            # Only the experience filters read CandidateProfile columns
+            if filters["min_experience"] is not None or filters["max_experience"] is not None:
+                count_query = count_query.outerjoin(CandidateProfile, Candidate.id == CandidateProfile.candidate_id)
+            count_query = _apply_candidate_filters(count_query, **filters)
+            total_count = int((await db.execute(count_query)).scalar_one() or 0)
+            if len(_summary_counts) >= 256:
+                _summary_counts.clear()
+            _summary_counts[key] = (time.monotonic() + _SUMMARY_COUNT_TTL_SECONDS, total_count)
+        finally:
+            # Retired while held, and only if no newer lock has replaced it
+            if _summary_count_locks.get(key) is lock:
+                del _summary_count_locks[key]
+    return total_count
+
+
 @router.get("/{candidate_id}/detail", response_model=CandidateDetailResponse)
 async def get_candidate_detail(
     candidate_id: int,
@@ -704,32 +1017,37 @@ async def get_candidate_detail(
 ) -> dict:
     """Get candidate with profile and analysis history."""
     result = await db.execute(
-        select(Candidate, CandidateProfile, CandidateAnalysis)
-        .outerjoin(CandidateProfile, Candidate.id == CandidateProfile.candidate_id)
-        .outerjoin(CandidateAnalysis, Candidate.id == CandidateAnalysis.candidate_id)
+        select(Candidate)
+        .options(
+            joinedload(Candidate.profile),
+            joinedload(Candidate.analysis),
+            selectinload(Candidate.analysis_runs).joinedload(CandidateAnalysisRun.job_description),
+        )
         .where(Candidate.id == candidate_id)
     )
-    row = result.first()
-    if not row:
+    candidate = result.unique().scalar_one_or_none()
+    if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
-    candidate, profile, analysis = row
-    history_result = await db.execute(
-        select(CandidateAnalysisRun, JobDescription)
-        .join(JobDescription, CandidateAnalysisRun.job_description_id == JobDescription.id)
-        .where(CandidateAnalysisRun.candidate_id == candidate_id)
-        .order_by(CandidateAnalysisRun.analysis_timestamp.desc())
+    # Newest first, as in the summary query; runs without a timestamp sort last
+    runs = sorted(
+        (run for run in candidate.analysis_runs if run.job_description is not None),
+        key=lambda run: (
+            run.analysis_timestamp is not None,
+            run.analysis_timestamp or datetime.min,
+            run.id,
+        ),
+        reverse=True,
     )
-    history_rows = history_result.all()
     history = []
-    for run, jd in history_rows:
+    for run in runs:
         payload = run.to_dict()
-        payload["job_description_title"] = jd.title
+        payload["job_description_title"] = run.job_description.title
         history.append(payload)
     return {
         "candidate": candidate.to_dict(),
-        "profile": profile.to_dict() if profile else None,
-        "analysis": analysis.to_dict() if analysis else None,
+        "profile": candidate.profile.to_dict() if candidate.profile else None,
+        "analysis": candidate.analysis.to_dict() if candidate.analysis else None,
         "analysis_history": history,
     }
 
@@ -777,7 +1095,7 @@ async def update_candidate(
         candidate.phone = phone
 
     await db.commit()
-    await db.refresh(candidate)
+    _summary_counts.clear()
     return candidate.to_dict()
 
 
@@ -785,7 +1103,7 @@ async def update_candidate(
 async def download_candidate_resume(
     candidate_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
+) -> FileResponse:
     """Download stored resume."""
     result = await db.execute(select(Candidate).where(Candidate.id == candidate_id))
     candidate = result.scalar_one_or_none()
@@ -796,77 +1114,181 @@ async def download_candidate_resume(
         raise HTTPException(status_code=404, detail="Resume file missing on disk")
 
     filename = os.path.basename(candidate.resume_file_path)
-    with open(candidate.resume_file_path, "rb") as f:
-        data = f.read()
-    return StreamingResponse(
-        BytesIO(data),
+    # FileResponse streams the file in chunks from a worker thread and builds an
+    # RFC 6266 Content-Disposition header from filename (filename* for non-ASCII names)
+    return FileResponse(
+        candidate.resume_file_path,
         media_type="application/octet-stream",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        filename=filename,
     )
 
 
 @router.post("/bulk-upload", response_model=list[CandidateResponse], status_code=201)
 async def bulk_upload_candidates(
     db: Annotated[AsyncSession, Depends(get_db)],
+    ollama: Annotated[OllamaService, Depends(get_ollama_service)],
     job_description_id: Annotated[int | None, Form()] = None,
     files: list[UploadFile] = File(...),
 ) -> list[Candidate]:
     """Bulk upload resumes from a folder."""
     if job_description_id is not None:
-        jd_result = await db.execute(
-            select(JobDescription).where(JobDescription.id == job_description_id)
-        )
-        if not jd_result.scalar_one_or_none():
+        if not await _job_description_exists(db, job_description_id):
             raise HTTPException(status_code=404, detail="Job description not found")
 
-    parser = ResumeParser()
-    ollama = OllamaService()
-    created: list[Candidate] = []
-
-    for file in files:
-        ext = os.path.splitext(file.filename or "")[1].lower()
-        if ext not in {".pdf", ".doc", ".docx", ".txt"}:
-            continue
-        content = await file.read()
-        try:
-            resume_text = parser.parse_and_clean(file.filename, content)
-        except ValueError:
-            resume_text = ""
-        invalid_resume = not _is_likely_resume(resume_text)
-        base_name = os.path.basename(file.filename or "")
-        name_guess = os.path.splitext(base_name)[0].replace("_", " ").strip() or "Candidate"
-        duplicate = await _find_duplicate_candidate(db, name_guess, _extract_email(resume_text))
-        if duplicate:
-            continue
-        stored_path = _save_resume_file(file.filename, content, name_guess)
-        email_guess = _extract_email(resume_text)
-        phone_guess = _extract_phone(resume_text)
-
-        candidate = Candidate(
-            name=name_guess,
-            email=email_guess,
-            phone=phone_guess,
-            resume_text=resume_text or " ",
-            resume_file_path=stored_path,
-            job_description_id=job_description_id,
+    accepted = [
+        file
+        for file in files
+        if os.path.splitext(file.filename or "")[1].lower() in {".pdf", ".doc", ".docx", ".txt"}
+    ]
+    staged: list[tuple[UploadFile, str, str]] = []
+    try:
+        # Copy all uploads to disk concurrently; keep every staged file for cleanup before re-raising
+        stage_results = await asyncio.gather(
+            *(_stage_upload(file, file.filename) for file in accepted), return_exceptions=True
         )
-        db.add(candidate)
-        await db.flush()
-        await _build_profile(candidate.id, resume_text, ollama, invalid_resume, db)
-        if job_description_id is not None:
-            db.add(
-                CandidateJobLink(
-                    candidate_id=candidate.id,
-                    job_description_id=job_description_id,
-                    confidence=1.0,
-                    linked_by="manual",
+        for file, stage_result in zip(accepted, stage_results):
+            if not isinstance(stage_result, BaseException):
+                staged.append((file, *stage_result))
+        for stage_result in stage_results:
+            if isinstance(stage_result, BaseException):
+                raise stage_result
+
+        # Drop files uploaded before, or repeated within this batch, before parsing anything
+        seen_hashes: set[str] = set()
+        if staged:
+            hash_result = await db.execute(
+                select(Candidate.resume_hash).where(
+                    Candidate.resume_hash.in_({resume_hash for _, _, resume_hash in staged})
                 )
             )
-        else:
-            await _auto_link_candidate_to_jds(db, candidate.id, resume_text)
-        created.append(candidate)
+            seen_hashes.update(hash_result.scalars())
+        unique: list[tuple[UploadFile, str, str]] = []
+        for entry in staged:
+            if entry[2] not in seen_hashes:
+                seen_hashes.add(entry[2])
+                unique.append(entry)
+
+        # Parse all resumes straight from disk, split across the parser worker pool in batches
+        parse_results = await ResumeParser.parse_batch_async([staged_path for _, staged_path, _ in unique])
+
+        parsed: list[tuple[UploadFile, str, str, str, bool, str, str | None]] = []
+        for (file, staged_path, resume_hash), resume_text in zip(unique, parse_results):
+            if isinstance(resume_text, ValueError):
+                resume_text = ""
+            invalid_resume = not _is_likely_resume(resume_text)
+            base_name = os.path.basename(file.filename or "")
+            name_guess = os.path.splitext(base_name)[0].replace("_", " ").strip() or "Candidate"
+            parsed.append(
+                (
+                    file,
+                    staged_path,
+                    resume_hash,
+                    resume_text,
+                    invalid_resume,
+                    name_guess,
+                    _extract_email(resume_text),
+                )
+            )
+        if not parsed:
+            return []
 
-    await db.commit()
+        # Look up possible duplicates for the whole upload in one query
+        existing_result = await db.execute(
+            select(Candidate.name, Candidate.email).where(
+                func.lower(Candidate.name).in_({name_guess.lower() for *_, name_guess, _ in parsed})
+            )
+        )
+        existing_names: set[str] = set()
+        existing_pairs: set[tuple[str, str]] = set()
+        for name, email in existing_result.all():
+            existing_names.add(name.lower())
+            if email:
+                existing_pairs.add((name.lower(), email.lower()))
+
+        new_candidates: list[tuple[dict, str, bool]] = []
+        for file, staged_path, resume_hash, resume_text, invalid_resume, name_guess, email_guess in parsed:
+            name_key = name_guess.lower()
+            if email_guess:
+                if (name_key, email_guess.lower()) in existing_pairs:
+                    continue
+                existing_pairs.add((name_key, email_guess.lower()))
+            elif name_key in existing_names:
+                continue
+            existing_names.add(name_key)
+
+            stored_path = _store_staged_resume(staged_path, file.filename, name_guess)
+            candidate_row = {
+                "name": name_guess,
+                "email": email_guess,
+                "phone": _extract_phone(resume_text),
+                "resume_text": resume_text or " ",
+                "resume_file_path": stored_path,
+                "resume_hash": resume_hash,
+                "job_description_id": job_description_id,
+            }
+            new_candidates.append((candidate_row, resume_text, invalid_resume))
+    finally:
+        # Drop staged files that were not kept (duplicates, parse failures)
+        await _unlink_many([staged_path for _, staged_path, _ in staged])
+
+    # Resumes were moved into place above; they are only kept once their rows commit
+    stored_paths = [candidate_row["resume_file_path"] for candidate_row, _, _ in new_candidates]
+    try:
+        # Extract all profiles concurrently, before any rows are written, with a bounded
+        # number of LLM calls in flight
+        semaphore = asyncio.Semaphore(max(get_settings().ollama_batch_size, 1))
+
+        async def extract_one(resume_text: str, invalid_resume: bool) -> dict:
+            async with semaphore:
+                return await _extract_profile_data(resume_text, ollama, invalid_resume)
+
+        profiles = await asyncio.gather(
+            *(extract_one(resume_text, invalid_resume) for _, resume_text, invalid_resume in new_candidates)
+        )
+
+        if not new_candidates:
+            return []
+
+        # One multi-row INSERT each for candidates, profiles and links. SQLite does not promise
+        # RETURNING order, so inserted rows are matched back by their (batch-unique) resume hash.
+        result = await db.scalars(
+            insert(Candidate).returning(Candidate),
+            [candidate_row for candidate_row, _, _ in new_candidates],
+        )
+        inserted = {candidate.resume_hash: candidate for candidate in result.all()}
+        created = [inserted[candidate_row["resume_hash"]] for candidate_row, _, _ in new_candidates]
+
+        match_index = await _jd_match_index(db) if job_description_id is None else None
+        link_rows = []
+        for candidate, (_, resume_text, _) in zip(created, new_candidates):
+            if job_description_id is not None:
+                selected = [(job_description_id, 1.0)]
+                linked_by = "manual"
+            else:
+                selected = _score_jd_links(resume_text, match_index)
+                linked_by = "ai"
+            link_rows.extend(
+                {
+                    "candidate_id": candidate.id,
+                    "job_description_id": jd_id,
+                    "confidence": score,
+                    "linked_by": linked_by,
+                }
+                for jd_id, score in selected
+            )
+
+        await db.execute(
+            insert(CandidateProfile),
+            [{"candidate_id": candidate.id, **profile_data} for candidate, profile_data in zip(created, profiles)],
+        )
+        if link_rows:
+            await db.execute(insert(CandidateJobLink), link_rows)
+
+        await db.commit()
+    except BaseException:
+        await _unlink_many(stored_paths)
+        raise
+    _summary_counts.clear()
     return [candidate.to_dict() for candidate in created]
 
 
@@ -891,26 +1313,43 @@ async def download_candidates_pdf(
     if not rows:
         raise HTTPException(status_code=404, detail="Candidates not found or analyses missing")
 
-    zip_buffer = BytesIO()
-    with ZipFile(zip_buffer, "w", ZIP_DEFLATED) as zip_file:
-        for candidate, analysis, jd in rows:
-            pdf_bytes = build_candidate_analysis_pdf(
-                candidate.to_dict(), analysis.to_dict(), jd.to_dict()
-            )
-            safe_name = _safe_filename(candidate.name or f"candidate_{candidate.id}")
-            filename = f"{safe_name}_{candidate.id}_analysis.pdf"
-            zip_file.writestr(filename, pdf_bytes)
+    # Serialize up front so the stream does not depend on the request's session
+    entries = [
+        (
+            f"{_safe_filename(candidate.name or f'candidate_{candidate.id}')}_{candidate.id}_analysis.pdf",
+            candidate.to_dict(),
+            analysis.to_dict(),
+            jd.to_dict(),
+        )
+        for candidate, analysis, jd in rows
+    ]
+
+    async def _iter_zip():
+        # Render every PDF in parallel, but add them to the archive in order as they finish
+        renders = [
+            asyncio.ensure_future(build_candidate_analysis_pdf_async(candidate_data, analysis_data, jd_data))
+            for _, candidate_data, analysis_data, jd_data in entries
+        ]
+        try:
+            buffer = _ZipStreamBuffer()
+            with ZipFile(buffer, "w", ZIP_DEFLATED) as zip_file:
+                for (filename, _, _, _), render in zip(entries, renders):
+                    zip_file.writestr(filename, await render)
+                    yield buffer.drain()
+            yield buffer.drain()
+        finally:
+            for render in renders:
+                render.cancel()
 
-    zip_buffer.seek(0)
     headers = {"Content-Disposition": "attachment; filename=candidate_analyses.zip"}
-    return StreamingResponse(zip_buffer, media_type="application/zip", headers=headers)
+    return StreamingResponse(_iter_zip(), media_type="application/zip", headers=headers)
 
 
 @router.get("/{candidate_id}/analysis/pdf")
 async def download_candidate_pdf(
     candidate_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
+) -> Response:
     """
     Download a single candidate analysis as a PDF file.
     """
@@ -925,20 +1364,21 @@ async def download_candidate_pdf(
         raise HTTPException(status_code=404, detail="Candidate not found or analysis missing")
 
     candidate, analysis, jd = row
-    pdf_bytes = build_candidate_analysis_pdf(
+    pdf_bytes = await build_candidate_analysis_pdf_async(
         candidate.to_dict(), analysis.to_dict(), jd.to_dict()
     )
     safe_name = _safe_filename(candidate.name or f"candidate_{candidate.id}")
     filename = f"{safe_name}_{candidate.id}_analysis.pdf"
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return StreamingResponse(BytesIO(pdf_bytes), media_type="application/pdf", headers=headers)
+    headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    # The PDF is already rendered in memory, so send it as one sized body rather than a chunked stream
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
 
 @router.get("/{candidate_id}", response_model=CandidateWithAnalysisResponse)
 async def get_candidate(
     candidate_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> dict:
+) -> CandidateWithAnalysisResponse:
     """
     Get a specific candidate with their analysis.
 
@@ -953,29 +1393,53 @@ async def get_candidate(
         HTTPException: If candidate not found
     """
     result = await db.execute(
-        select(Candidate, CandidateAnalysis)
-        .outerjoin(CandidateAnalysis, Candidate.id == CandidateAnalysis.candidate_id)
+        select(Candidate)
+        .options(
+            load_only(*_CANDIDATE_RESPONSE_COLUMNS),
+            joinedload(Candidate.analysis),
+        )
         .where(Candidate.id == candidate_id)
     )
-
-    row = result.first()
-    if not row:
+    candidate = result.unique().scalar_one_or_none()
+    if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
-    candidate, analysis = row
+    # Built straight from the ORM objects so FastAPI does not re-validate a dict
+    return CandidateWithAnalysisResponse.model_validate(
+        {"candidate": candidate, "analysis": candidate.analysis}, from_attributes=True
+    )
 
-    return {
-        "candidate": candidate.to_dict(),
-        "analysis": analysis.to_dict() if analysis else None,
-    }
+
+async def _analyze_once(
+    agent: HiringAgent,
+    db: AsyncSession,
+    candidate_id: int,
+    job_description_id: int | None,
+) -> CandidateAnalysis:
+    """Run the agent once per (candidate, JD) pair and let concurrent duplicates share it."""
+    analysis, ran_here = await _analysis_inflight.do(
+        (candidate_id, job_description_id),
+        lambda: agent.analyze_candidate(candidate_id, job_description_id, db),
+    )
+    if ran_here:
+        return analysis
+
+    # The leader has committed the analysis, so read it back in this session
+    analysis = await db.scalar(
+        select(CandidateAnalysis).where(CandidateAnalysis.candidate_id == candidate_id)
+    )
+    if analysis is not None:
+        return analysis
+    return await agent.analyze_candidate(candidate_id, job_description_id, db)
 
 
 @router.post("/{candidate_id}/analyze", response_model=CandidateWithAnalysisResponse)
 async def analyze_candidate(
     candidate_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
+    agent: Annotated[HiringAgent, Depends(get_hiring_agent)],
     job_description_id: int | None = None,
-) -> dict:
+) -> CandidateWithAnalysisResponse:
     """
     Analyze a candidate and generate hiring recommendation.
 
@@ -989,35 +1453,23 @@ async def analyze_candidate(
     Raises:
         HTTPException: If candidate not found
     """
-    # Verify candidate exists
-    result = await db.execute(select(Candidate).where(Candidate.id == candidate_id))
-    candidate = result.scalar_one_or_none()
-
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
-
-    # Run analysis
-    agent = HiringAgent()
-    analysis = await agent.analyze_candidate(candidate_id, job_description_id, db)
+    # The agent loads the candidate itself and reports a missing one as a ValueError
+    try:
+        analysis = await _analyze_once(agent, db, candidate_id, job_description_id)
+    except ValueError as e:
+        detail = str(e)
+        if detail.startswith("Candidate not found"):
+            raise HTTPException(status_code=404, detail="Candidate not found")
+        if detail.startswith("Job description not found"):
+            raise HTTPException(status_code=404, detail="Job description not found")
+        raise
 
-    # Return candidate with analysis
-    result = await db.execute(
-        select(Candidate, CandidateAnalysis)
-        .where(Candidate.id == candidate_id)
-        .where(CandidateAnalysis.candidate_id == candidate_id)
+    # The candidate is already in the session's identity map, so this issues no query
+    candidate = await db.get(Candidate, candidate_id)
+    return CandidateWithAnalysisResponse.model_validate(
+        {"candidate": candidate, "analysis": analysis}, from_attributes=True
     )
 
-    row = result.first()
-    if not row:
-        raise HTTPException(status_code=404, detail="Analysis failed")
-
-    candidate, analysis = row
-
-    return {
-        "candidate": candidate.to_dict(),
-        "analysis": analysis.to_dict() if analysis else None,
-    }
-
 
 @router.delete("/{candidate_id}", status_code=200)
 async def delete_candidate(
@@ -1034,35 +1486,32 @@ async def delete_candidate(
     Raises:
         HTTPException: If candidate not found
     """
-    result = await db.execute(select(Candidate).where(Candidate.id == candidate_id))
-    candidate = result.scalar_one_or_none()
-
-    if not candidate:
+    deleted_paths = await _delete_candidates(db, [candidate_id])
+    if not deleted_paths:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
-    resume_path = candidate.resume_file_path
-    await db.delete(candidate)
     await db.commit()
-    if resume_path and os.path.exists(resume_path):
-        try:
-            os.remove(resume_path)
-        except OSError:
-            pass
+    _summary_counts.clear()
+    if deleted_paths[0]:
+        await _unlink_many([deleted_paths[0]])
     return {"status": "deleted", "candidate_id": candidate_id}
 
 
-async def _resolve_bulk_candidate_ids(payload: dict | list[int], db: AsyncSession) -> list[int]:
+async def _resolve_bulk_candidate_ids(
+    payload: CandidateSelectionRequest | list[int],
+    db: AsyncSession,
+) -> list[int]:
+    # Explicit id lists are deduplicated (keeping order) so repeated ids never reach IN (...) or the link insert
     if isinstance(payload, list):
-        return [int(candidate_id) for candidate_id in payload]
+        return list(dict.fromkeys(payload))
 
-    candidate_ids = payload.get("candidate_ids") or []
-    if candidate_ids:
-        return [int(candidate_id) for candidate_id in candidate_ids]
+    if payload.candidate_ids:
+        return list(dict.fromkeys(payload.candidate_ids))
 
-    if not payload.get("all_matching"):
+    if not payload.all_matching:
         return []
 
-    filters = payload.get("filters") or {}
+    filters = payload.filters
     try:
         job_description_id = int(filters.get("job_description_id")) if filters.get("job_description_id") not in (None, "") else None
     except (TypeError, ValueError):
@@ -1075,7 +1524,7 @@ async def _resolve_bulk_candidate_ids(payload: dict | list[int], db: AsyncSessio
         max_experience = float(filters.get("max_experience")) if filters.get("max_experience") not in (None, "") else None
     except (TypeError, ValueError):
         max_experience = None
-    excluded_ids = [int(candidate_id) for candidate_id in (payload.get("excluded_ids") or [])]
+    excluded_ids = payload.excluded_ids
 
     query = select(Candidate.id).outerjoin(CandidateProfile, Candidate.id == CandidateProfile.candidate_id)
     query = _apply_candidate_filters(
@@ -1095,9 +1544,50 @@ async def _resolve_bulk_candidate_ids(payload: dict | list[int], db: AsyncSessio
     return [int(candidate_id) for candidate_id in result.scalars().all()]
 
 
+async def _delete_candidates(db: AsyncSession, candidate_ids: list[int]) -> list[str | None]:
+    """Delete candidates and their dependent rows, chunking large id lists.
+
+    Returns the resume file path of each deleted candidate.
+    """
+    # Keep each IN list well under SQLite's bound-parameter limit
+    deleted_paths: list[str | None] = []
+    for start in range(0, len(candidate_ids), _DELETE_CHUNK_SIZE):
+        deleted_paths.extend(
+            await _delete_candidate_rows(db, candidate_ids[start : start + _DELETE_CHUNK_SIZE])
+        )
+    return deleted_paths
+
+
+async def _delete_candidate_rows(db: AsyncSession, candidate_ids: list[int]) -> list[str | None]:
+    """Delete candidates and their dependent rows with one DELETE per table.
+
+    Mirrors the delete-orphan cascades on Candidate without loading any ORM
+    objects.
+    """
+    session_ids = select(InterviewSession.id).where(InterviewSession.candidate_id.in_(candidate_ids))
+    question_ids = select(InterviewQuestion.id).where(InterviewQuestion.session_id.in_(session_ids))
+    statements = [
+        delete(InterviewResponse).where(InterviewResponse.question_id.in_(question_ids)),
+        delete(InterviewQuestion).where(InterviewQuestion.session_id.in_(session_ids)),
+        delete(InterviewFeedback).where(InterviewFeedback.session_id.in_(session_ids)),
+    ]
+    for model in (InterviewSession, CandidateProfile, CandidateAnalysis, CandidateAnalysisRun, CandidateJobLink):
+        statements.append(delete(model).where(model.candidate_id.in_(candidate_ids)))
+    for statement in statements:
+        await db.execute(statement.execution_options(synchronize_session=False))
+
+    result = await db.execute(
+        delete(Candidate)
+        .where(Candidate.id.in_(candidate_ids))
+        .returning(Candidate.resume_file_path)
+        .execution_options(synchronize_session=False)
+    )
+    return list(result.scalars())
+
+
 @router.post("/bulk-delete")
 async def bulk_delete_candidates(
-    payload: dict | list[int],
+    payload: CandidateSelectionRequest | list[int],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict:
     """Bulk delete candidates and their resumes."""
@@ -1105,60 +1595,53 @@ async def bulk_delete_candidates(
     if not candidate_ids:
         raise HTTPException(status_code=400, detail="candidate_ids required")
 
-    result = await db.execute(select(Candidate).where(Candidate.id.in_(candidate_ids)))
-    candidates = list(result.scalars().all())
-    resume_paths = [c.resume_file_path for c in candidates if c.resume_file_path]
-
-    for candidate in candidates:
-        await db.delete(candidate)
+    deleted_paths = await _delete_candidates(db, candidate_ids)
     await db.commit()
-
-    removed_files = 0
-    for path in resume_paths:
-        if path and os.path.exists(path):
-            try:
-                os.remove(path)
-                removed_files += 1
-            except OSError:
-                pass
+    _summary_counts.clear()
+    removed_files = await _unlink_many([path for path in deleted_paths if path])
 
     return {
         "status": "deleted",
-        "deleted_candidates": len(candidates),
+        "deleted_candidates": len(deleted_paths),
         "deleted_files": removed_files,
     }
 
 
 @router.post("/link-jd")
 async def bulk_link_candidates_to_jd(
-    payload: dict,
+    payload: CandidateLinkRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict:
     """Link candidates to a job description."""
     candidate_ids = await _resolve_bulk_candidate_ids(payload, db)
-    job_description_id = payload.get("job_description_id")
-    if not candidate_ids or not job_description_id:
-        raise HTTPException(status_code=400, detail="candidate_ids and job_description_id required")
+    job_description_id = payload.job_description_id
+    if not candidate_ids:
+        raise HTTPException(status_code=400, detail="candidate_ids required")
 
-    jd_result = await db.execute(
-        select(JobDescription).where(JobDescription.id == job_description_id)
-    )
-    if not jd_result.scalar_one_or_none():
+    if not await _job_description_exists(db, job_description_id):
         raise HTTPException(status_code=404, detail="Job description not found")
 
+    # One multi-row INSERT per chunk; links that already exist are skipped
+    rows = [
+        {
+            "candidate_id": candidate_id,
+            "job_description_id": job_description_id,
+            "confidence": 1.0,
+            "linked_by": "manual",
+        }
+        for candidate_id in candidate_ids
+    ]
     created = 0
-    for candidate_id in candidate_ids:
-        db.add(
-            CandidateJobLink(
-                candidate_id=candidate_id,
-                job_description_id=job_description_id,
-                confidence=1.0,
-                linked_by="manual",
-            )
+    for start in range(0, len(rows), _LINK_INSERT_CHUNK_SIZE):
+        result = await db.execute(
+            insert(CandidateJobLink)
+            .values(rows[start : start + _LINK_INSERT_CHUNK_SIZE])
+            .on_conflict_do_nothing(index_elements=["candidate_id", "job_description_id"])
         )
-        created += 1
+        created += result.rowcount
 
     await db.commit()
+    _summary_counts.clear()
     return {"status": "linked", "links_created": created}
 
 
@@ -1167,25 +1650,30 @@ async def clear_all_candidates(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict:
     """Delete all candidates and their resumes."""
-    result = await db.execute(select(Candidate))
-    candidates = list(result.scalars().all())
-    resume_paths = [c.resume_file_path for c in candidates if c.resume_file_path]
-
-    for candidate in candidates:
-        await db.delete(candidate)
-    await db.commit()
-
+    # Delete in committed chunks so other writers can get the database lock in
+    # between, removing each chunk's files while the next chunk is deleted
+    deleted_candidates = 0
     removed_files = 0
-    for path in resume_paths:
-        if path and os.path.exists(path):
-            try:
-                os.remove(path)
-                removed_files += 1
-            except OSError:
-                pass
+    unlink_task: asyncio.Task | None = None
+    while True:
+        result = await db.execute(select(Candidate.id).order_by(Candidate.id).limit(_CLEAR_ALL_CHUNK_SIZE))
+        candidate_ids = list(result.scalars())
+        if not candidate_ids:
+            break
+        deleted_paths = await _delete_candidate_rows(db, candidate_ids)
+        await db.commit()
+        _summary_counts.clear()
+        deleted_candidates += len(deleted_paths)
+        if unlink_task is not None:
+            removed_files += await unlink_task
+        unlink_task = asyncio.create_task(_unlink_many([path for path in deleted_paths if path]))
+        if len(candidate_ids) < _CLEAR_ALL_CHUNK_SIZE:
+            break
+    if unlink_task is not None:
+        removed_files += await unlink_task
 
     return {
         "status": "cleared",
-        "deleted_candidates": len(candidates),
+        "deleted_candidates": deleted_candidates,
         "deleted_files": removed_files,
     }
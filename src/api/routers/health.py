@@ -1,37 +1,28 @@
 """Router for health check endpoints."""
 
 from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from src.api.schemas import HealthResponse
-from src.llm.ollama_service import OllamaService
+from src.llm.ollama_service import OllamaService, get_ollama_service
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
 @router.get("", response_model=HealthResponse)
-async def health_check() -> dict:
+async def health_check(
+    ollama: Annotated[OllamaService, Depends(get_ollama_service)],
+) -> dict:
     """
     Health check endpoint.
 
     Returns:
         Health status with Ollama connection info
     """
-    ollama = OllamaService()
-    ollama_connected = True
-    ollama_model = ollama.model
-
-    try:
-        # Try a simple invocation to verify connection
-        # This is a lightweight check
-        import httpx
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{ollama.base_url}/api/tags")
-            if response.status_code != 200:
-                ollama_connected = False
-    except Exception:
-        ollama_connected = False
-        ollama_model = None
+    # Lightweight check over the shared client, so polling does not open new connections
+    ollama_connected = await ollama.is_available(timeout=5.0)
+    ollama_model = ollama.model if ollama_connected else None
 
     return {
         "status": "healthy",
@@ -40,7 +40,6 @@ async def create_job_description(
     )
     db.add(jd)
     await db.commit()
-    await db.refresh(jd)
     return jd.to_dict()
 
 
@@ -136,7 +135,6 @@ async def update_job_description(
         jd.domain = jd_data.domain
 
     await db.commit()
-    await db.refresh(jd)
     return jd.to_dict()
 
 
@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.agent.hiring_agent import HiringAgent
+from src.agent.hiring_agent import HiringAgent, get_hiring_agent
 from src.api.schemas import (
     HiringReportResponse,
     InterviewStrategyResponse,
@@ -19,13 +19,20 @@ router = APIRouter(prefix="/reports", tags=["Reports"])
 async def get_hiring_report(
     job_description_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
+    agent: Annotated[HiringAgent, Depends(get_hiring_agent)],
+    limit_per_decision: Annotated[int, Query(ge=1, le=1000)] = 50,
 ) -> dict:
     """
     Generate a comprehensive hiring report for a job description.
 
+    The summary counts every analyzed candidate, but each decision list (and so
+    ``ranked_candidates``) holds only the top ``limit_per_decision`` scorers;
+    ``truncated`` reports which lists were cut.
+
     Args:
         job_description_id: Job description ID
         db: Database session
+        limit_per_decision: Maximum candidates listed per decision bucket
 
     Returns:
         Hiring report with statistics and recommendations
@@ -33,8 +40,7 @@ async def get_hiring_report(
     Raises:
         HTTPException: If job description not found
     """
-    agent = HiringAgent()
-    report = await agent.generate_hiring_report(job_description_id)
+    report = await agent.generate_hiring_report(job_description_id, limit_per_decision)
     return report
 
 
@@ -42,6 +48,7 @@ async def get_hiring_report(
 async def get_interview_strategy(
     candidate_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
+    agent: Annotated[HiringAgent, Depends(get_hiring_agent)],
 ) -> dict:
     """
     Get interview strategy for a specific candidate.
@@ -56,7 +63,6 @@ async def get_interview_strategy(
     Raises:
         HTTPException: If candidate not found
     """
-    agent = HiringAgent()
     strategy = await agent.get_interview_strategy(candidate_id)
     return strategy
 
@@ -65,6 +71,7 @@ async def get_interview_strategy(
 async def get_candidate_ranking(
     job_description_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
+    agent: Annotated[HiringAgent, Depends(get_hiring_agent)],
     limit: Annotated[int, Query] = 10,
 ) -> dict:
     """
@@ -78,7 +85,6 @@ async def get_candidate_ranking(
     Returns:
         Ranked list of candidates
     """
-    agent = HiringAgent()
     ranked = await agent.rank_candidates(job_description_id, limit)
     return {
         "job_description_id": job_description_id,
@@ -1,9 +1,15 @@
 """API request and response schemas."""
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, Field
+
+# Let response models read ORM rows directly: datetimes go out as ISO strings, NULL lists as []
+_IsoTimestamp = Annotated[
+    str | None, BeforeValidator(lambda value: value.isoformat() if isinstance(value, datetime) else value)
+]
+_StrList = Annotated[list[str], BeforeValidator(lambda value: value or [])]
 
 
 # Job Description Schemas
@@ -61,6 +67,21 @@ class CandidateCreateFromFile(BaseModel):
     job_description_id: int | None = Field(None, description="ID of the job description")
 
 
+class CandidateSelectionRequest(BaseModel):
+    """Schema for selecting candidates for a bulk action."""
+
+    candidate_ids: list[int] = Field(default_factory=list, description="Explicitly selected candidate IDs")
+    all_matching: bool = Field(False, description="Select every candidate matching the filters")
+    excluded_ids: list[int] = Field(default_factory=list, description="IDs left out when all_matching is set")
+    filters: dict[str, Any] = Field(default_factory=dict, description="Candidate list filters used with all_matching")
+
+
+class CandidateLinkRequest(CandidateSelectionRequest):
+    """Schema for linking selected candidates to a job description."""
+
+    job_description_id: int = Field(..., description="ID of the job description")
+
+
 class CandidateResponse(BaseModel):
     """Schema for candidate response."""
 
@@ -71,11 +92,23 @@ class CandidateResponse(BaseModel):
     resume_text: str
     resume_file_path: str | None
     job_description_id: int | None
-    created_at: str | None
+    created_at: _IsoTimestamp
 
     model_config = {"from_attributes": True}
 
 
+class CandidateListItemResponse(BaseModel):
+    """Schema for candidate list entries, without the resume text."""
+
+    id: int
+    name: str
+    email: str | None
+    phone: str | None
+    resume_file_path: str | None
+    job_description_id: int | None
+    created_at: str | None
+
+
 class CandidateProfileResponse(BaseModel):
     """Schema for candidate profile response."""
 
@@ -207,13 +240,13 @@ class CandidateAnalysisResponse(BaseModel):
 
     id: int
     candidate_id: int
-    skills: list[str]
+    skills: _StrList
     experience_years: float
-    tech_stack: list[str]
-    domain_knowledge: list[str]
+    tech_stack: _StrList
+    domain_knowledge: _StrList
     seniority: str | None
-    strengths: list[str]
-    weaknesses: list[str]
+    strengths: _StrList
+    weaknesses: _StrList
     skill_match_score: float
     experience_score: float
     domain_score: float
@@ -222,14 +255,14 @@ class CandidateAnalysisResponse(BaseModel):
     final_score: float
     decision: str | None
     recommendation: str | None
-    risks: list[str]
+    risks: _StrList
     risk_level: str | None
-    technical_questions: list[str]
-    system_design_questions: list[str]
-    behavioral_questions: list[str]
-    custom_questions: list[str]
-    interview_focus_areas: list[str]
-    analysis_timestamp: str | None
+    technical_questions: _StrList
+    system_design_questions: _StrList
+    behavioral_questions: _StrList
+    custom_questions: _StrList
+    interview_focus_areas: _StrList
+    analysis_timestamp: _IsoTimestamp
     model_used: str | None
 
     model_config = {
@@ -274,6 +307,14 @@ class HiringReportSummary(BaseModel):
     average_score: float
 
 
+class HiringReportTruncation(BaseModel):
+    """Which decision lists in a hiring report were cut at ``limit_per_decision``."""
+
+    strong_hires: bool
+    borderline: bool
+    rejects: bool
+
+
 class HiringReportResponse(BaseModel):
     """Schema for hiring report response."""
 
@@ -283,6 +324,7 @@ class HiringReportResponse(BaseModel):
     strong_hires: list[dict[str, Any]]
     borderline: list[dict[str, Any]]
     rejects: list[dict[str, Any]]
+    truncated: HiringReportTruncation
     generated_at: str
 
 
@@ -22,12 +22,23 @@ class Settings(BaseSettings):
     ollama_model: str = Field(default="kimi-k2.5:cloud", description="Ollama model to use")
     ollama_timeout: int = Field(default=300, description="Ollama request timeout in seconds")
     ollama_use_chat: bool = Field(default=False, description="Use ChatOllama client when available")
+    ollama_batch_size: int = Field(default=8, description="Max resume analyses or bulk-upload profile extractions dispatched at once")
+    ollama_batch_window_ms: int = Field(default=20, description="Max wait for a resume analysis batch to fill")
 
     # API Configuration
     api_host: str = Field(default="0.0.0.0", description="API host")
     api_port: int = Field(default=8000, description="API port")
     api_reload: bool = Field(default=True, description="Enable API auto-reload")
+    api_workers: int | None = Field(
+        default=None,
+        description="Number of API worker processes (defaults to WEB_CONCURRENCY or the CPU count; ignored with reload)",
+    )
     api_base_url: str = Field(default="", description="Base URL for UI API calls")
+    cors_origins_csv: str = Field(
+        default="http://localhost:8000,http://127.0.0.1:8000",
+        description="Origins allowed to call the API cross-origin (comma-separated)",
+    )
+    cors_max_age: int = Field(default=86400, description="Seconds browsers may cache CORS preflight responses")
 
     # Database
     database_url: str = Field(default="sqlite+aiosqlite:///./hiring_agent.db", description="Database connection URL")
@@ -88,6 +99,11 @@ class Settings(BaseSettings):
         description="Allowed Gmail attachment extensions (comma-separated)",
     )
 
+    @property
+    def cors_origins(self) -> list[str]:
+        """Return allowed CORS origins."""
+        return [origin.strip().rstrip("/") for origin in self.cors_origins_csv.split(",") if origin.strip()]
+
     @property
     def outlook_allowed_extensions(self) -> set[str]:
         """Return allowed Outlook attachment extensions."""
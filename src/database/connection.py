@@ -6,12 +6,16 @@ from typing import AsyncGenerator
 from sqlalchemy import event
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config.settings import get_settings
 from src.database.models import Base
 
 settings = get_settings()
 
+# How long SQLite waits on a locked database before raising "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = 30000
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
@@ -19,18 +23,35 @@ engine = create_async_engine(
     future=True,
     connect_args={
         "check_same_thread": False,
-        "timeout": 30,
+        "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+    },
+)
+
+# SQLite allows a single writer at a time; funnelling writes through one pooled
+# connection queues them in the pool instead of contending for the file lock.
+write_engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=1,
+    max_overflow=0,
+    connect_args={
+        "check_same_thread": False,
+        "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
     },
 )
 
 
 @event.listens_for(engine.sync_engine, "connect")
+@event.listens_for(write_engine.sync_engine, "connect")
 def _set_sqlite_pragma(dbapi_connection, connection_record):
+    # Runs for every pooled connection, not just the first one opened.
     cursor = dbapi_connection.cursor()
     try:
         cursor.execute("PRAGMA journal_mode=WAL;")
         cursor.execute("PRAGMA synchronous=NORMAL;")
-        cursor.execute("PRAGMA busy_timeout=30000;")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS};")
     finally:
         cursor.close()
 
@@ -41,6 +62,12 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+async_write_session_maker = async_sessionmaker(
+    write_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def init_db() -> None:
     """Initialize database tables."""
@@ -48,12 +75,19 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
         await conn.run_sync(_migrate_candidates_job_description_nullable)
         await conn.run_sync(_migrate_candidate_profiles_headline)
+        await conn.run_sync(_migrate_candidates_resume_hash)
         await conn.run_sync(_ensure_candidate_job_links)
+        await conn.run_sync(_ensure_indexes)
+        await conn.run_sync(_ensure_resume_search)
+        await conn.run_sync(_ensure_profile_skill_search)
 
 
 async def drop_db() -> None:
     """Drop all database tables."""
     async with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            await conn.exec_driver_sql("DROP TABLE IF EXISTS candidates_fts;")
+            await conn.exec_driver_sql("DROP TABLE IF EXISTS candidate_profiles_fts;")
         await conn.run_sync(Base.metadata.drop_all)
 
 
@@ -71,6 +105,20 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def get_write_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a session bound to the single-connection writer engine."""
+    async with async_write_session_maker() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session for FastAPI dependency injection."""
     async with async_session_maker() as session:
@@ -147,3 +195,144 @@ def _migrate_candidate_profiles_headline(connection) -> None:
     if "headline" in col_names:
         return
     connection.exec_driver_sql("ALTER TABLE candidate_profiles ADD COLUMN headline VARCHAR(255);")
+
+
+def _migrate_candidates_resume_hash(connection) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    columns = connection.execute(text("PRAGMA table_info(candidates)")).fetchall()
+    col_names = {col[1] for col in columns}
+    if "resume_hash" in col_names:
+        return
+    connection.exec_driver_sql("ALTER TABLE candidates ADD COLUMN resume_hash VARCHAR(64);")
+
+
+def _ensure_indexes(connection) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    # create_all only builds indexes for new tables; add them to existing databases.
+    connection.exec_driver_sql(
+        """
+        CREATE INDEX IF NOT EXISTS ix_candidate_analysis_runs_jd_candidate_id
+        ON candidate_analysis_runs (job_description_id, candidate_id, id);
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        CREATE INDEX IF NOT EXISTS ix_candidate_analysis_runs_candidate_latest
+        ON candidate_analysis_runs (candidate_id, analysis_timestamp, id);
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        CREATE INDEX IF NOT EXISTS ix_candidates_job_description_id
+        ON candidates (job_description_id);
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        CREATE INDEX IF NOT EXISTS ix_candidates_resume_hash
+        ON candidates (resume_hash);
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        CREATE INDEX IF NOT EXISTS ix_candidates_lower_name_email
+        ON candidates (lower(name), lower(email));
+        """
+    )
+    # Refresh planner statistics where they are stale so the indexes get used
+    connection.exec_driver_sql("PRAGMA optimize;")
+
+
+def _ensure_resume_search(connection) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    # Trigram full-text index over candidate names and resume text; it answers
+    # LIKE '%term%' substring filters without reading every candidate.
+    columns = [row[1] for row in connection.exec_driver_sql("PRAGMA table_info(candidates_fts);").fetchall()]
+    if columns and "name" not in columns:
+        # Older databases indexed resume_text only; rebuild with the name column
+        for trigger in ("candidates_fts_ai", "candidates_fts_ad", "candidates_fts_au"):
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger};")
+        connection.exec_driver_sql("DROP TABLE candidates_fts;")
+        columns = []
+    if not columns:
+        connection.exec_driver_sql(
+            """
+            CREATE VIRTUAL TABLE candidates_fts USING fts5(
+                name, resume_text, content='candidates', content_rowid='id', tokenize='trigram'
+            );
+            """
+        )
+        connection.exec_driver_sql("INSERT INTO candidates_fts (candidates_fts) VALUES ('rebuild');")
+    connection.exec_driver_sql(
+        """
+        CREATE TRIGGER IF NOT EXISTS candidates_fts_ai AFTER INSERT ON candidates BEGIN
+            INSERT INTO candidates_fts (rowid, name, resume_text) VALUES (new.id, new.name, new.resume_text);
+        END;
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        CREATE TRIGGER IF NOT EXISTS candidates_fts_ad AFTER DELETE ON candidates BEGIN
+            INSERT INTO candidates_fts (candidates_fts, rowid, name, resume_text)
+            VALUES ('delete', old.id, old.name, old.resume_text);
+        END;
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        CREATE TRIGGER IF NOT EXISTS candidates_fts_au AFTER UPDATE OF name, resume_text ON candidates BEGIN
+            INSERT INTO candidates_fts (candidates_fts, rowid, name, resume_text)
+            VALUES ('delete', old.id, old.name, old.resume_text);
+            INSERT INTO candidates_fts (rowid, name, resume_text) VALUES (new.id, new.name, new.resume_text);
+        END;
+        """
+    )
+
+
+def _ensure_profile_skill_search(connection) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    # Trigram index over the profile skill lists (stored as JSON text) for the skills filter
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candidate_profiles_fts';"
+    ).first()
+    if not exists:
+        connection.exec_driver_sql(
+            """
+            CREATE VIRTUAL TABLE candidate_profiles_fts USING fts5(
+                primary_skills, secondary_skills,
+                content='candidate_profiles', content_rowid='id', tokenize='trigram'
+            );
+            """
+        )
+        connection.exec_driver_sql("INSERT INTO candidate_profiles_fts (candidate_profiles_fts) VALUES ('rebuild');")
+    connection.exec_driver_sql(
+        """
+        CREATE TRIGGER IF NOT EXISTS candidate_profiles_fts_ai AFTER INSERT ON candidate_profiles BEGIN
+            INSERT INTO candidate_profiles_fts (rowid, primary_skills, secondary_skills)
+            VALUES (new.id, new.primary_skills, new.secondary_skills);
+        END;
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        CREATE TRIGGER IF NOT EXISTS candidate_profiles_fts_ad AFTER DELETE ON candidate_profiles BEGIN
+            INSERT INTO candidate_profiles_fts (candidate_profiles_fts, rowid, primary_skills, secondary_skills)
+            VALUES ('delete', old.id, old.primary_skills, old.secondary_skills);
+        END;
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        CREATE TRIGGER IF NOT EXISTS candidate_profiles_fts_au
+        AFTER UPDATE OF primary_skills, secondary_skills ON candidate_profiles BEGIN
+            INSERT INTO candidate_profiles_fts (candidate_profiles_fts, rowid, primary_skills, secondary_skills)
+            VALUES ('delete', old.id, old.primary_skills, old.secondary_skills);
+            INSERT INTO candidate_profiles_fts (rowid, primary_skills, secondary_skills)
+            VALUES (new.id, new.primary_skills, new.secondary_skills);
+        END;
+        """
+    )
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 from sqlalchemy import (
     JSON,
@@ -9,10 +10,14 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    column,
+    func,
+    table,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -78,7 +83,11 @@ class Candidate(Base):
     phone: Mapped[str] = mapped_column(String(50), nullable=True)
     resume_text: Mapped[str] = mapped_column(Text, nullable=False)
     resume_file_path: Mapped[str] = mapped_column(String(500), nullable=True)
-    job_description_id: Mapped[int | None] = mapped_column(ForeignKey("job_descriptions.id"), nullable=True)
+    # BLAKE2b digest of the uploaded resume file, used to skip re-uploads of the same file
+    resume_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    job_description_id: Mapped[int | None] = mapped_column(
+        ForeignKey("job_descriptions.id"), nullable=True, index=True
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -104,18 +113,30 @@ class Candidate(Base):
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        return self.serialize(self)
+
+    @staticmethod
+    def serialize(values: Any) -> dict:
+        """Convert any object exposing the candidate columns as attributes (e.g. a Core row)."""
         return {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "phone": self.phone,
-            "resume_text": self.resume_text,
-            "resume_file_path": self.resume_file_path,
-            "job_description_id": self.job_description_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "id": values.id,
+            "name": values.name,
+            "email": values.email,
+            "phone": values.phone,
+            "resume_text": values.resume_text,
+            "resume_file_path": values.resume_file_path,
+            "job_description_id": values.job_description_id,
+            "created_at": values.created_at.isoformat() if values.created_at else None,
         }
 
 
+# Case-insensitive duplicate lookups by name and email
+Index("ix_candidates_lower_name_email", func.lower(Candidate.name), func.lower(Candidate.email))
+
+# Trigram FTS5 index over candidates.name and resume_text, maintained by triggers (see init_db)
+candidates_fts = table("candidates_fts", column("rowid"), column("name"), column("resume_text"))
+
+
 class CandidateProfile(Base):
     """Extended candidate profile details."""
 
@@ -162,6 +183,12 @@ class CandidateProfile(Base):
         }
 
 
+# Trigram FTS5 index over the profile skill lists, maintained by triggers (see init_db)
+candidate_profiles_fts = table(
+    "candidate_profiles_fts", column("rowid"), column("primary_skills"), column("secondary_skills")
+)
+
+
 class CandidateAnalysis(Base):
     """Candidate analysis results model."""
 
@@ -245,6 +272,20 @@ class CandidateAnalysisRun(Base):
     """Immutable analysis history for candidates per job description."""
 
     __tablename__ = "candidate_analysis_runs"
+    __table_args__ = (
+        Index(
+            "ix_candidate_analysis_runs_jd_candidate_id",
+            "job_description_id",
+            "candidate_id",
+            "id",
+        ),
+        Index(
+            "ix_candidate_analysis_runs_candidate_latest",
+            "candidate_id",
+            "analysis_timestamp",
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.id"), nullable=False)
@@ -287,36 +328,42 @@ class CandidateAnalysisRun(Base):
     model_used: Mapped[str] = mapped_column(String(100), nullable=True)
 
     candidate: Mapped["Candidate"] = relationship(back_populates="analysis_runs")
+    job_description: Mapped["JobDescription"] = relationship()
 
     def to_dict(self) -> dict:
+        return self.serialize(self)
+
+    @staticmethod
+    def serialize(values: Any) -> dict:
+        """Convert any object exposing the analysis run columns as attributes (e.g. a Core row)."""
         return {
-            "id": self.id,
-            "candidate_id": self.candidate_id,
-            "job_description_id": self.job_description_id,
-            "skills": self.skills or [],
-            "experience_years": self.experience_years,
-            "tech_stack": self.tech_stack or [],
-            "domain_knowledge": self.domain_knowledge or [],
-            "seniority": self.seniority,
-            "strengths": self.strengths or [],
-            "weaknesses": self.weaknesses or [],
-            "skill_match_score": self.skill_match_score,
-            "experience_score": self.experience_score,
-            "domain_score": self.domain_score,
-            "project_complexity_score": self.project_complexity_score,
-            "soft_skills_score": self.soft_skills_score,
-            "final_score": self.final_score,
-            "decision": self.decision,
-            "recommendation": self.recommendation,
-            "risks": self.risks or [],
-            "risk_level": self.risk_level,
-            "technical_questions": self.technical_questions or [],
-            "system_design_questions": self.system_design_questions or [],
-            "behavioral_questions": self.behavioral_questions or [],
-            "custom_questions": self.custom_questions or [],
-            "interview_focus_areas": self.interview_focus_areas or [],
-            "analysis_timestamp": self.analysis_timestamp.isoformat() if self.analysis_timestamp else None,
-            "model_used": self.model_used,
+            "id": values.id,
+            "candidate_id": values.candidate_id,
+            "job_description_id": values.job_description_id,
+            "skills": values.skills or [],
+            "experience_years": values.experience_years,
+            "tech_stack": values.tech_stack or [],
+            "domain_knowledge": values.domain_knowledge or [],
+            "seniority": values.seniority,
+            "strengths": values.strengths or [],
+            "weaknesses": values.weaknesses or [],
+            "skill_match_score": values.skill_match_score,
+            "experience_score": values.experience_score,
+            "domain_score": values.domain_score,
+            "project_complexity_score": values.project_complexity_score,
+            "soft_skills_score": values.soft_skills_score,
+            "final_score": values.final_score,
+            "decision": values.decision,
+            "recommendation": values.recommendation,
+            "risks": values.risks or [],
+            "risk_level": values.risk_level,
+            "technical_questions": values.technical_questions or [],
+            "system_design_questions": values.system_design_questions or [],
+            "behavioral_questions": values.behavioral_questions or [],
+            "custom_questions": values.custom_questions or [],
+            "interview_focus_areas": values.interview_focus_areas or [],
+            "analysis_timestamp": values.analysis_timestamp.isoformat() if values.analysis_timestamp else None,
+            "model_used": values.model_used,
         }
 
 
@@ -349,6 +396,16 @@ class CandidateJobLink(Base):
         }
 
 
+class AnalysisCacheEntry(Base):
+    """Cached LLM analysis payloads keyed by (model, resume, JD) fingerprint."""
+
+    __tablename__ = "analysis_cache"
+
+    fingerprint: Mapped[str] = mapped_column(String(64), primary_key=True)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class HiringAction(Base):
     """Hiring action log model."""
 
@@ -0,0 +1,120 @@
+"""Micro-batching of concurrent resume analysis requests."""
+
+import asyncio
+import copy
+from typing import Any
+
+from src.llm.ollama_service import OllamaService
+
+
+class AnalysisBatcher:
+    """Coalesce concurrent ``analyze_resume`` calls into batched dispatches.
+
+    A submission to an idle batcher is dispatched right away; while a batch
+    is in flight, new submissions are collected for a short window. Identical
+    resume/JD pairs are deduplicated, and the remaining requests are sent to
+    the inference server together, ordered by JD so requests sharing the same
+    prompt prefix are adjacent.
+    """
+
+    def __init__(
+        self,
+        ollama: OllamaService,
+        max_batch_size: int = 8,
+        max_wait_ms: int = 20,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            ollama: Ollama service used to run the analyses
+            max_batch_size: Flush as soon as this many requests are pending
+            max_wait_ms: Maximum time a request waits for its batch to fill while
+                another batch is in flight
+        """
+        self.ollama = ollama
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait_ms, 0) / 1000
+        self._pending: list[tuple[str, str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, resume_text: str, jd_text: str) -> dict[str, Any]:
+        """
+        Queue a resume analysis and wait for its result.
+
+        Args:
+            resume_text: Resume text content
+            jd_text: Job description text
+
+        Returns:
+            Analysis results for this resume/JD pair
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((resume_text, jd_text, future))
+
+        # Nothing to coalesce with when idle; submissions made in the same
+        # loop tick still join this batch before the flush task runs.
+        idle = len(self._pending) == 1 and not self._tasks
+        if idle or len(self._pending) >= self.max_batch_size:
+            self._schedule_flush(loop, delay=None)
+        elif self._timer is None:
+            self._schedule_flush(loop, delay=self.max_wait)
+
+        return await future
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, delay: float | None) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if delay is None:
+            self._start_flush(loop)
+        else:
+            self._timer = loop.call_later(delay, self._start_flush, loop)
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        task = loop.create_task(self._flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self) -> None:
+        batch = self._pending[: self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size :]
+        if not batch:
+            return
+        if self._pending:
+            loop = asyncio.get_running_loop()
+            if len(self._pending) >= self.max_batch_size:
+                self._schedule_flush(loop, delay=None)
+            elif self._timer is None:
+                self._schedule_flush(loop, delay=self.max_wait)
+
+        # Deduplicate identical requests and keep same-JD prompts adjacent.
+        waiters: dict[tuple[str, str], list[asyncio.Future]] = {}
+        for resume_text, jd_text, future in batch:
+            waiters.setdefault((jd_text, resume_text), []).append(future)
+        keys = sorted(waiters, key=lambda key: key[0])
+
+        try:
+            results = await asyncio.gather(
+                *(self.ollama.analyze_resume(resume_text=resume_text, jd_text=jd_text) for jd_text, resume_text in keys),
+                return_exceptions=True,
+            )
+        except BaseException:
+            # Cancelled (e.g. at shutdown): release the waiters instead of leaving them hanging
+            for futures in waiters.values():
+                for future in futures:
+                    future.cancel()
+            raise
+
+        for key, result in zip(keys, results):
+            for future in waiters[key]:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    # Callers normalize the payload in place, so each gets its own copy.
+                    future.set_result(copy.deepcopy(result))
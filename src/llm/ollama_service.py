@@ -5,12 +5,145 @@ import asyncio
 import json
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
+import httpx
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.config.settings import get_settings
 
+ANALYSIS_FAILED_PREFIX = "LLM analysis failed"
+
+_ANALYSIS_SYSTEM_PROMPT = """You are an AI hiring agent for an IT company. Your task is to analyze resumes against job descriptions and provide structured, objective assessments.
+
+You must:
+1. Extract skills, experience, domain knowledge, strengths, and weaknesses from the resume
+2. Compare with the job description
+3. Score the candidate on multiple dimensions (0-100)
+4. Identify potential risks
+5. Suggest interview questions
+6. Provide a hiring recommendation
+
+Be objective and fair. Focus on evidence from the resume rather than assumptions."""
+
+_ANALYSIS_INSTRUCTIONS = """Analyze the following resume against the job description.
+
+Provide your analysis in the following JSON format:
+{
+    "skills": ["skill1", "skill2", ...],
+    "experience_years": <number>,
+    "tech_stack": ["tech1", "tech2", ...],
+    "domain_knowledge": ["domain1", "domain2", ...],
+    "seniority": "<junior|mid-level|senior|lead|principal>",
+    "strengths": ["strength1", "strength2", ...],
+    "weaknesses": ["weakness1", "weakness2", ...],
+    "skill_match_score": <0-100>,
+    "experience_score": <0-100>,
+    "domain_score": <0-100>,
+    "project_complexity_score": <0-100>,
+    "soft_skills_score": <0-100>,
+    "risks": ["risk1", "risk2", ...],
+    "risk_level": "<low|medium|high>",
+    "technical_questions": ["question1", "question2", ...],
+    "system_design_questions": ["question1", "question2", ...],
+    "behavioral_questions": ["question1", "question2", ...],
+    "custom_questions": ["question1", "question2", ...],
+    "interview_focus_areas": ["area1", "area2", ...],
+    "recommendation": "<detailed recommendation text>"
+}
+
+Ensure all scores are between 0 and 100. Be specific and evidence-based in your analysis."""
+
+_PROFILE_SYSTEM_PROMPT = """You are an AI assistant that extracts structured candidate profile information from resumes."""
+
+_PROFILE_INSTRUCTIONS = """Extract a concise candidate profile from the resume below.
+
+Provide your response in the following JSON format:
+{
+  "current_role": "<current or most recent role title>",
+  "headline": "<short professional headline>",
+  "total_experience_years": <number>,
+  "primary_skills": ["skill1", "skill2", ...],
+  "secondary_skills": ["skill1", "skill2", ...],
+  "education": "<highest degree or key education summary>",
+  "certifications": ["cert1", "cert2", ...],
+  "summary": "<2-3 sentence summary>",
+  "location": "<city, country if present>",
+  "linkedin_url": "<url if present>",
+  "portfolio_url": "<url if present>"
+}
+
+If a field is not present, use null or an empty list as appropriate."""
+
+_NAME_SYSTEM_PROMPT = "You extract a candidate's full name from resume text."
+
+_NAME_INSTRUCTIONS = """Extract the candidate's full name from the resume below.
+
+Provide your response in the following JSON format:
+{
+  "name": "<candidate full name>"
+}
+
+If the name is not present, return null."""
+
+
+# Shared keep-alive connection pool for direct Ollama HTTP calls, bound to one event loop
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, recreating it for a new event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=300),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client, _http_client_loop
+    client, loop = _http_client, _http_client_loop
+    _http_client, _http_client_loop = None, None
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+class _JsonObjectTracker:
+    """Detect when streamed text has closed its first top-level JSON object."""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk; return True once the object's closing brace is seen."""
+        for char in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.started
+            elif char == "{":
+                self.depth += 1
+                self.started = True
+            elif char == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
 
 class OllamaService:
     """Service for interacting with Ollama LLM."""
@@ -52,36 +185,55 @@ class OllamaService:
             self.base_url,
         )
 
-    async def _http_invoke(self, messages: list[dict[str, str]]) -> str:
-        import httpx
-
+    async def _http_invoke(self, messages: list[dict[str, str]], stop_after_json: bool = False) -> str:
         payload = {
             "model": self.model,
             "messages": messages,
-            "stream": False,
+            "stream": True,
             "options": {"temperature": self.temperature},
         }
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(f"{self.base_url}/api/chat", json=payload)
+        parts: list[str] = []
+        tracker = _JsonObjectTracker() if stop_after_json else None
+        client = _get_http_client()
+        async with client.stream(
+            "POST", f"{self.base_url}/api/chat", json=payload, timeout=self.timeout
+        ) as response:
             response.raise_for_status()
-            data = response.json()
-
-        content = None
-        if isinstance(data, dict):
-            content = (data.get("message") or {}).get("content")
-            if content is None:
-                content = data.get("response")
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if data.get("error"):
+                    raise ValueError(f"Ollama error: {data['error']}")
+                chunk = (data.get("message") or {}).get("content") or data.get("response") or ""
+                if chunk:
+                    parts.append(chunk)
+                    # Closing the stream once the JSON object is complete stops generation early
+                    if tracker is not None and tracker.feed(chunk):
+                        break
+                if data.get("done"):
+                    break
+
+        content = "".join(parts)
         if not content:
             raise ValueError("Ollama response missing content")
         return content
 
+    async def is_available(self, timeout: float = 5.0) -> bool:
+        """Check that the Ollama server answers, reusing the shared connection pool."""
+        try:
+            response = await _get_http_client().get(f"{self.base_url}/api/tags", timeout=timeout)
+        except Exception:
+            return False
+        return response.status_code == 200
 
-    async def invoke(self, messages: list[dict[str, str]]) -> str:
+    async def invoke(self, messages: list[dict[str, str]], stop_after_json: bool = False) -> str:
         """
         Invoke the LLM with messages.
 
         Args:
             messages: List of message dicts with 'role' and 'content'
+            stop_after_json: Stop reading once the first JSON object in the response is complete
 
         Returns:
             LLM response text
@@ -125,7 +277,7 @@ class OllamaService:
             )
         for attempt in range(1, 4):
             try:
-                return await self._http_invoke(messages)
+                return await self._http_invoke(messages, stop_after_json=stop_after_json)
             except Exception as e:
                 last_error = e
                 logger.warning(
@@ -156,7 +308,7 @@ class OllamaService:
         Raises:
             ValueError: If response cannot be parsed as JSON
         """
-        response_text = await self.invoke(messages)
+        response_text = await self.invoke(messages, stop_after_json=True)
         logger = logging.getLogger(__name__)
 
         # Try to extract JSON from response
@@ -222,54 +374,17 @@ class OllamaService:
         Returns:
             Analysis results with skills, scores, risks, etc.
         """
-        system_prompt = """You are an AI hiring agent for an IT company. Your task is to analyze resumes against job descriptions and provide structured, objective assessments.
-
-You must:
-1. Extract skills, experience, domain knowledge, strengths, and weaknesses from the resume
-2. Compare with the job description
-3. Score the candidate on multiple dimensions (0-100)
-4. Identify potential risks
-5. Suggest interview questions
-6. Provide a hiring recommendation
-
-Be objective and fair. Focus on evidence from the resume rather than assumptions."""
-
-        user_prompt = f"""Analyze the following resume against the job description.
-
-RESUME:
-{resume_text}
-
-JOB DESCRIPTION:
-{jd_text}
-
-Provide your analysis in the following JSON format:
-{{
-    "skills": ["skill1", "skill2", ...],
-    "experience_years": <number>,
-    "tech_stack": ["tech1", "tech2", ...],
-    "domain_knowledge": ["domain1", "domain2", ...],
-    "seniority": "<junior|mid-level|senior|lead|principal>",
-    "strengths": ["strength1", "strength2", ...],
-    "weaknesses": ["weakness1", "weakness2", ...],
-    "skill_match_score": <0-100>,
-    "experience_score": <0-100>,
-    "domain_score": <0-100>,
-    "project_complexity_score": <0-100>,
-    "soft_skills_score": <0-100>,
-    "risks": ["risk1", "risk2", ...],
-    "risk_level": "<low|medium|high>",
-    "technical_questions": ["question1", "question2", ...],
-    "system_design_questions": ["question1", "question2", ...],
-    "behavioral_questions": ["question1", "question2", ...],
-    "custom_questions": ["question1", "question2", ...],
-    "interview_focus_areas": ["area1", "area2", ...],
-    "recommendation": "<detailed recommendation text>"
-}}
-
-Ensure all scores are between 0 and 100. Be specific and evidence-based in your analysis."""
+        # Static instructions first, then the JD, then the resume: every candidate
+        # analyzed against the same JD shares an identical prompt prefix, which
+        # lets the inference server reuse its prefix (KV) cache.
+        user_prompt = (
+            f"{_ANALYSIS_INSTRUCTIONS}\n\n"
+            f"JOB DESCRIPTION:\n{jd_text}\n\n"
+            f"RESUME:\n{resume_text}"
+        )
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _ANALYSIS_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt},
         ]
 
@@ -297,37 +412,16 @@ Ensure all scores are between 0 and 100. Be specific and evidence-based in your
                 "behavioral_questions": [],
                 "custom_questions": [],
                 "interview_focus_areas": [],
-                "recommendation": f"LLM analysis failed: {exc}",
+                "recommendation": f"{ANALYSIS_FAILED_PREFIX}: {exc}",
             }
 
     async def extract_candidate_profile(self, resume_text: str) -> dict[str, Any]:
         """Extract a concise candidate profile from resume text."""
-        system_prompt = """You are an AI assistant that extracts structured candidate profile information from resumes."""
-
-        user_prompt = f"""Extract a concise candidate profile from the resume below.
-
-RESUME:
-{resume_text}
-
-Provide your response in the following JSON format:
-{{
-  "current_role": "<current or most recent role title>",
-  "headline": "<short professional headline>",
-  "total_experience_years": <number>,
-  "primary_skills": ["skill1", "skill2", ...],
-  "secondary_skills": ["skill1", "skill2", ...],
-  "education": "<highest degree or key education summary>",
-  "certifications": ["cert1", "cert2", ...],
-  "summary": "<2-3 sentence summary>",
-  "location": "<city, country if present>",
-  "linkedin_url": "<url if present>",
-  "portfolio_url": "<url if present>"
-}}
-
-If a field is not present, use null or an empty list as appropriate."""
+        # Static prompt first so every profile extraction shares the same prefix
+        user_prompt = f"{_PROFILE_INSTRUCTIONS}\n\nRESUME:\n{resume_text}"
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _PROFILE_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt},
         ]
 
@@ -335,21 +429,10 @@ If a field is not present, use null or an empty list as appropriate."""
 
     async def extract_candidate_name(self, resume_text: str) -> dict[str, Any]:
         """Extract candidate name from resume text."""
-        system_prompt = "You extract a candidate's full name from resume text."
-        user_prompt = f"""Extract the candidate's full name from the resume below.
-
-RESUME:
-{resume_text}
-
-Provide your response in the following JSON format:
-{{
-  "name": "<candidate full name>"
-}}
-
-If the name is not present, return null."""
+        user_prompt = f"{_NAME_INSTRUCTIONS}\n\nRESUME:\n{resume_text}"
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _NAME_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt},
         ]
 
@@ -492,3 +575,9 @@ Only include genuine risks supported by evidence in the resume."""
         ]
 
         return await self.invoke_with_json(messages)
+
+
+@lru_cache(maxsize=1)
+def get_ollama_service() -> OllamaService:
+    """Get the shared Ollama service instance."""
+    return OllamaService()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from src.llm.ollama_service import OllamaService
+from src.llm.ollama_service import get_ollama_service
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,7 @@ class ResumeClassifier:
     """Classify resumes into tech stack and job category."""
 
     def __init__(self) -> None:
-        self._llm = OllamaService()
+        self._llm = get_ollama_service()
 
     async def classify_resume(self, resume_text: str) -> dict[str, Any]:
         """Classify resume text into structured metadata."""
@@ -1,8 +1,11 @@
 """Resume parser for extracting text from various file formats."""
 
+import asyncio
 import io
+import os
 import zipfile
-from typing import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Sequence
 from io import BytesIO
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -11,6 +14,9 @@ from typing import Optional
 from docx import Document
 from pypdf import PdfReader
 
+# Worker processes for CPU-bound parsing, created on first use
+_parser_pool: ProcessPoolExecutor | None = None
+
 
 class ResumeParser:
     """Parser for extracting text from resume files."""
@@ -234,3 +240,73 @@ class ResumeParser:
         """
         raw_text = cls.parse(file_path, file_content)
         return cls.clean_text(raw_text)
+
+    @classmethod
+    async def parse_and_clean_async(cls, file_path: str | Path, file_content: Optional[bytes] = None) -> str:
+        """
+        Parse and clean a resume in a worker process without blocking the event loop.
+
+        Args:
+            file_path: Path to the resume file
+            file_content: Optional file content bytes
+
+        Returns:
+            Cleaned extracted text
+        """
+        global _parser_pool
+        if _parser_pool is None:
+            _parser_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_parser_pool, cls.parse_and_clean, file_path, file_content)
+
+    @classmethod
+    def parse_batch(cls, file_paths: Sequence[str | Path]) -> list[str | ValueError]:
+        """
+        Parse and clean several resume files in one call.
+
+        Args:
+            file_paths: Paths of the resume files
+
+        Returns:
+            Cleaned text for each file, or the ValueError raised while parsing it
+        """
+        results: list[str | ValueError] = []
+        for file_path in file_paths:
+            try:
+                results.append(cls.parse_and_clean(file_path))
+            except ValueError as e:
+                results.append(e)
+        return results
+
+    @classmethod
+    async def parse_batch_async(cls, file_paths: Sequence[str | Path]) -> list[str | ValueError]:
+        """
+        Parse a batch of resumes with one worker-pool task per worker rather than per file.
+
+        Args:
+            file_paths: Paths of the resume files
+
+        Returns:
+            Cleaned text for each file in input order, or the ValueError raised while parsing it
+        """
+        global _parser_pool
+        if not file_paths:
+            return []
+        workers = os.cpu_count() or 1
+        if _parser_pool is None:
+            _parser_pool = ProcessPoolExecutor(max_workers=workers)
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(file_paths) // workers)
+        chunks = [list(file_paths[i : i + chunk_size]) for i in range(0, len(file_paths), chunk_size)]
+        chunk_results = await asyncio.gather(
+            *(loop.run_in_executor(_parser_pool, cls.parse_batch, chunk) for chunk in chunks)
+        )
+        return [result for chunk in chunk_results for result in chunk]
+
+
+def shutdown_parser_pool() -> None:
+    """Stop the resume parsing worker processes, if they were started."""
+    global _parser_pool
+    if _parser_pool is not None:
+        _parser_pool.shutdown(wait=False, cancel_futures=True)
+        _parser_pool = None
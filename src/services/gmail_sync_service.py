@@ -10,7 +10,7 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.agent.hiring_agent import HiringAgent
+from src.agent.hiring_agent import get_hiring_agent
 from src.database.models import Candidate, CandidateJobLink
 from src.services.gmail_activity_log import GmailActivityLog
 from src.services.gmail_ingestion_service import GmailIngestionService
@@ -55,7 +55,7 @@ class GmailSyncService:
             no_jd_match_candidates = 0
             analysis_errors = 0
             errors = list(ingestion.errors)
-            agent = HiringAgent()
+            agent = get_hiring_agent()
 
             for candidate_payload in ingestion.imported_candidates:
                 candidate_id = candidate_payload.get("id")
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from src.llm.ollama_service import OllamaService
+from src.llm.ollama_service import get_ollama_service
 
 
 @dataclass
@@ -20,7 +20,7 @@ class InterviewService:
     """Service for generating and scoring interview questions."""
 
     def __init__(self) -> None:
-        self.llm = OllamaService()
+        self.llm = get_ollama_service()
 
     async def generate_questions(
         self,
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from typing import Any
 
@@ -9,6 +12,9 @@ from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import ListFlowable, ListItem, Paragraph, SimpleDocTemplate, Spacer
 
+# Worker processes for CPU-bound PDF rendering, created on first use
+_pdf_pool: ProcessPoolExecutor | None = None
+
 
 def build_candidate_analysis_pdf(
     candidate: dict[str, Any],
@@ -117,3 +123,24 @@ def _list_section(items: Any, styles: dict) -> ListFlowable:
 
     list_items = [ListItem(Paragraph(str(item), styles["BodyText"])) for item in items]
     return ListFlowable(list_items, bulletType="bullet", leftIndent=16)
+
+
+async def build_candidate_analysis_pdf_async(
+    candidate: dict[str, Any],
+    analysis: dict[str, Any],
+    job_description: dict[str, Any],
+) -> bytes:
+    """Build a candidate analysis PDF in a worker process without blocking the event loop."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pdf_pool, build_candidate_analysis_pdf, candidate, analysis, job_description)
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF rendering worker processes, if they were started."""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
@@ -2069,7 +2069,9 @@ async function loadCandidatesManagement() {
         cmCurrentItems = payload.items || [];
         cmNextCursor = payload.next_cursor || null;
         cmHasMore = Boolean(payload.has_more);
-        cmTotalCount = Number(payload.total_count || 0);
+        if (payload.total_count !== null && payload.total_count !== undefined) {
+            cmTotalCount = Number(payload.total_count);
+        }
         cmSelectionState.filters = filters;
         if (cmHasMore && cmNextCursor) {
             cmCursorByPage[cmCurrentPage + 1] = cmNextCursor;
@@ -2260,7 +2262,12 @@ function buildCmParams(filters, cursor = null) {
     if (filters.max_experience) params.append('max_experience', filters.max_experience);
     if (filters.job_description_id) params.append('job_description_id', filters.job_description_id);
     params.append('limit', String(cmPageSize));
-    if (cursor) params.append('cursor', cursor);
+    if (cursor) {
+        params.append('cursor', cursor);
+    } else {
+        // The total only changes with the filters, so it is fetched with the first page
+        params.append('include_total', 'true');
+    }
     return params;
 }
 
@@ -0,0 +1,91 @@
+"""Tests for the batched hiring action writer."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+
+from sqlalchemy import select
+
+from src.agent import action_queue as action_queue_module
+from src.agent.action_queue import HiringActionQueue
+from src.database.connection import get_db_session, get_write_session, init_db
+from src.database.models import HiringAction
+
+
+def _fail_first_write(monkeypatch) -> list[int]:
+    attempts = []
+
+    @asynccontextmanager
+    async def flaky_write_session():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("database is locked")
+        async with get_write_session() as session:
+            yield session
+
+    monkeypatch.setattr(action_queue_module, "get_write_session", flaky_write_session)
+    return attempts
+
+
+async def _descriptions(tag: str) -> list[str]:
+    async with get_db_session() as session:
+        result = await session.scalars(
+            select(HiringAction.description)
+            .where(HiringAction.description.startswith(tag))
+            .order_by(HiringAction.id)
+        )
+        return list(result)
+
+
+def test_worker_retries_failed_flush(monkeypatch):
+    """Rows from a failed write are requeued and written by the re-armed worker."""
+    attempts = _fail_first_write(monkeypatch)
+    tag = f"worker-{uuid.uuid4().hex}"
+
+    async def run():
+        await init_db()
+        queue = HiringActionQueue(flush_interval_ms=0)
+        queue.put(1, "note", f"{tag}-1")
+        queue.put(1, "note", f"{tag}-2")
+        await queue._task
+        return await _descriptions(tag)
+
+    assert asyncio.run(run()) == [f"{tag}-1", f"{tag}-2"]
+    assert len(attempts) == 2
+
+
+def test_close_retries_failed_flush(monkeypatch):
+    """close() keeps flushing until requeued rows are written."""
+    attempts = _fail_first_write(monkeypatch)
+    tag = f"close-{uuid.uuid4().hex}"
+
+    async def run():
+        await init_db()
+        queue = HiringActionQueue(flush_interval_ms=60_000)
+        queue.put(1, "note", f"{tag}-1")
+        await queue.close()
+        return await _descriptions(tag)
+
+    assert asyncio.run(run()) == [f"{tag}-1"]
+    assert len(attempts) == 2
+
+
+def test_flush_drops_rows_after_max_attempts(monkeypatch):
+    """A write that keeps failing is given up on instead of retried forever."""
+
+    @asynccontextmanager
+    async def broken_write_session():
+        raise RuntimeError("database is locked")
+        yield
+
+    monkeypatch.setattr(action_queue_module, "get_write_session", broken_write_session)
+
+    async def run():
+        queue = HiringActionQueue(flush_interval_ms=60_000, max_flush_attempts=2)
+        queue.put(1, "note", "never written")
+        assert await queue.flush() is False
+        assert len(queue._rows) == 1
+        assert await queue.flush() is False
+        return queue._rows
+
+    assert asyncio.run(run()) == []
@@ -0,0 +1,116 @@
+"""Tests for micro-batching resume analyses."""
+
+import asyncio
+
+import pytest
+
+from src.llm.analysis_batcher import AnalysisBatcher
+
+
+class FakeOllama:
+    """Records analyze_resume calls; calls for a gated resume block until released."""
+
+    def __init__(self, gated: str | None = None):
+        self.calls: list[str] = []
+        self.gated = gated
+        self.release = asyncio.Event()
+
+    async def analyze_resume(self, resume_text: str, jd_text: str) -> dict:
+        self.calls.append(resume_text)
+        if resume_text == self.gated:
+            await self.release.wait()
+        if resume_text.startswith("bad"):
+            raise RuntimeError(f"analysis failed for {resume_text}")
+        return {"resume": resume_text, "jd": jd_text}
+
+
+def test_idle_submission_is_dispatched_without_waiting():
+    """A lone submission does not sit out the batch window."""
+
+    async def run():
+        batcher = AnalysisBatcher(FakeOllama(), max_batch_size=8, max_wait_ms=10_000)
+        return await asyncio.wait_for(batcher.submit("r1", "jd"), timeout=1)
+
+    assert asyncio.run(run()) == {"resume": "r1", "jd": "jd"}
+
+
+def test_submissions_during_a_flush_wait_for_the_window():
+    """Requests arriving while a batch is in flight are collected and sent together."""
+
+    async def run():
+        ollama = FakeOllama(gated="r1")
+        batcher = AnalysisBatcher(ollama, max_batch_size=8, max_wait_ms=50)
+        first = asyncio.ensure_future(batcher.submit("r1", "jd"))
+        await asyncio.sleep(0.01)
+        assert ollama.calls == ["r1"]
+
+        later = [asyncio.ensure_future(batcher.submit(resume, "jd")) for resume in ("r2", "r3")]
+        await asyncio.sleep(0.01)
+        assert ollama.calls == ["r1"]
+
+        results = await asyncio.wait_for(asyncio.gather(*later), timeout=1)
+        assert sorted(ollama.calls[1:]) == ["r2", "r3"]
+        ollama.release.set()
+        await first
+        return results
+
+    assert asyncio.run(run()) == [{"resume": "r2", "jd": "jd"}, {"resume": "r3", "jd": "jd"}]
+
+
+def test_full_batch_flushes_before_the_window():
+    """Reaching max_batch_size dispatches at once, even while another batch runs."""
+
+    async def run():
+        ollama = FakeOllama(gated="r1")
+        batcher = AnalysisBatcher(ollama, max_batch_size=2, max_wait_ms=10_000)
+        first = asyncio.ensure_future(batcher.submit("r1", "jd"))
+        await asyncio.sleep(0.01)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("r2", "jd"), batcher.submit("r3", "jd")), timeout=1
+        )
+        ollama.release.set()
+        await first
+        return results
+
+    assert asyncio.run(run()) == [{"resume": "r2", "jd": "jd"}, {"resume": "r3", "jd": "jd"}]
+
+
+def test_errors_fan_out_to_every_waiter():
+    """Duplicate submissions share one call, and its failure reaches each of them."""
+
+    async def run():
+        ollama = FakeOllama()
+        batcher = AnalysisBatcher(ollama, max_batch_size=8, max_wait_ms=10_000)
+        results = await asyncio.gather(
+            batcher.submit("bad", "jd"),
+            batcher.submit("bad", "jd"),
+            batcher.submit("ok", "jd"),
+            return_exceptions=True,
+        )
+        return ollama.calls, results
+
+    calls, results = asyncio.run(run())
+    assert sorted(calls) == ["bad", "ok"]
+    for result in results[:2]:
+        with pytest.raises(RuntimeError, match="analysis failed for bad"):
+            raise result
+    assert results[2] == {"resume": "ok", "jd": "jd"}
+
+
+def test_cancelled_flush_releases_waiters():
+    """Cancelling an in-flight flush cancels its submitters instead of leaving them waiting."""
+
+    async def run():
+        ollama = FakeOllama(gated="r1")
+        batcher = AnalysisBatcher(ollama, max_batch_size=8, max_wait_ms=10_000)
+        submits = [asyncio.ensure_future(batcher.submit(resume, "jd")) for resume in ("r1", "r1", "r2")]
+        await asyncio.sleep(0.01)
+        assert sorted(ollama.calls) == ["r1", "r2"]
+
+        for task in list(batcher._tasks):
+            task.cancel()
+        return await asyncio.wait_for(asyncio.gather(*submits, return_exceptions=True), timeout=1)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
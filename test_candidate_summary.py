@@ -0,0 +1,91 @@
+"""Tests for the paged candidate summary total."""
+
+import asyncio
+import uuid
+
+from fastapi.testclient import TestClient
+
+from src.api.app import app
+from src.api.routers import candidates as candidates_router
+from src.database.connection import get_db_session
+from src.database.models import Candidate, CandidateJobLink
+
+SUMMARY_FILTERS = {
+    "job_description_id": None,
+    "name": None,
+    "skills": None,
+    "min_experience": None,
+    "max_experience": None,
+    "created_from": None,
+    "created_to": None,
+}
+
+
+async def _add_linked_candidate(job_description_id: int) -> None:
+    # Written directly so the endpoint's cache invalidation is not triggered
+    async with get_db_session() as session:
+        candidate = Candidate(name=f"Direct {uuid.uuid4().hex[:8]}", resume_text="resume")
+        session.add(candidate)
+        await session.flush()
+        session.add(
+            CandidateJobLink(
+                candidate_id=candidate.id,
+                job_description_id=job_description_id,
+                confidence=1.0,
+                linked_by="manual",
+            )
+        )
+
+
+def test_include_total_is_cached_until_it_expires():
+    """total_count is reused for identical filters within the TTL, then recounted."""
+    with TestClient(app) as client:
+        jd = client.post(
+            "/api/job-descriptions",
+            json={"title": "Summary Role", "description": "Python APIs", "required_skills": ["Python"]},
+        ).json()
+        client.post(
+            "/api/candidates",
+            json={"name": f"Summary {uuid.uuid4().hex[:8]}", "resume_text": "Python engineer", "job_description_id": jd["id"]},
+        )
+        url = f"/api/candidates/summary/paged?job_description_id={jd['id']}"
+
+        assert client.get(url).json()["total_count"] is None
+        assert client.get(f"{url}&include_total=true").json()["total_count"] == 1
+
+        client.portal.call(_add_linked_candidate, jd["id"])
+        assert client.get(f"{url}&include_total=true").json()["total_count"] == 1
+
+        # Expire the cached total
+        for key, (_, count) in list(candidates_router._summary_counts.items()):
+            candidates_router._summary_counts[key] = (0.0, count)
+        assert client.get(f"{url}&include_total=true").json()["total_count"] == 2
+
+    assert not candidates_router._summary_count_locks
+
+
+def test_concurrent_totals_share_one_count():
+    """Concurrent requests for the same filters run a single COUNT and leave no lock behind."""
+
+    class FakeResult:
+        def scalar_one(self):
+            return 7
+
+    class FakeSession:
+        executed = 0
+
+        async def execute(self, query):
+            FakeSession.executed += 1
+            await asyncio.sleep(0.01)
+            return FakeResult()
+
+    filters = dict(SUMMARY_FILTERS, name=f"concurrent-{uuid.uuid4().hex}")
+
+    async def run():
+        return await asyncio.gather(
+            *(candidates_router._count_summary_candidates(FakeSession(), **filters) for _ in range(5))
+        )
+
+    assert asyncio.run(run()) == [7] * 5
+    assert FakeSession.executed == 1
+    assert not candidates_router._summary_count_locks
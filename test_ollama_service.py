@@ -0,0 +1,35 @@
+"""Tests for the Ollama service helpers."""
+
+from src.llm.ollama_service import _JsonObjectTracker
+
+
+def _feed_all(chunks: list[str]) -> list[bool]:
+    tracker = _JsonObjectTracker()
+    return [tracker.feed(chunk) for chunk in chunks]
+
+
+def test_tracker_closes_on_matching_brace():
+    """Nested objects only finish the stream at the outermost closing brace."""
+    assert _feed_all(['{"a": {"b": 1}', "}"]) == [False, True]
+
+
+def test_tracker_ignores_braces_inside_strings():
+    """Braces in string values do not change the nesting depth."""
+    assert _feed_all(['{"text": "}{ }}"', "}"]) == [False, True]
+
+
+def test_tracker_handles_escaped_quotes():
+    """An escaped quote does not end the string, so the brace after it is still text."""
+    assert _feed_all(['{"text": "say \\"hi\\" }"', "}"]) == [False, True]
+    assert _feed_all(['{"path": "C:\\\\"}']) == [True]
+
+
+def test_tracker_handles_chunks_split_mid_object():
+    """State carries across chunks split inside strings and escape sequences."""
+    chunks = ['{"skills": ["Py', 'thon"], "note": "a \\', '"}\\" b"', ', "n": {"x": 1', "}}"]
+    assert _feed_all(chunks) == [False, False, False, False, True]
+
+
+def test_tracker_skips_text_before_the_object():
+    """Quotes and closing braces before the first ``{`` are ignored."""
+    assert _feed_all(['Here is "the" result} ', '{"ok": true}']) == [False, True]
@@ -0,0 +1,39 @@
+"""Tests for candidate scoring."""
+
+import random
+
+from src.agent.scoring_engine import ScoringEngine
+
+SCORE_FIELDS = (
+    "skill_match_score",
+    "experience_score",
+    "domain_score",
+    "project_complexity_score",
+    "soft_skills_score",
+)
+
+
+def test_single_and_batch_scoring_agree_on_decimal_subscores():
+    """score_candidate and score_many use the same arithmetic, so verdicts match."""
+    engine = ScoringEngine()
+    rng = random.Random(1234)
+    analyses = [
+        {
+            "skill_match_score": 55.3,
+            "experience_score": 55.3,
+            "domain_score": 67.4,
+            "project_complexity_score": 73.6,
+            "soft_skills_score": 65.8,
+            "risk_level": "low",
+        }
+    ]
+    analyses.extend(
+        {field: round(rng.uniform(0, 100), 1) for field in SCORE_FIELDS}
+        | {"risk_level": rng.choice(["low", "medium", "high"])}
+        for _ in range(2000)
+    )
+
+    batch = engine.score_many(analyses)
+    for analysis, batch_result in zip(analyses, batch):
+        single = engine.score_candidate(analysis)
+        assert (single.final_score, single.decision) == (batch_result.final_score, batch_result.decision)